@@ -14,21 +14,21 @@ def main():
     # Create calculator with default settings path
     calculator = ModelUsageCalculator()
     
-    # Extract model info (no log entries needed for settings extraction)
-    result = calculator.calculate([])
+    # Read model settings directly (no log entries needed)
+    settings = calculator.read_settings()
     
     print("📊 Model Configuration from Settings:")
     print("-" * 60)
-    print(f"  Primary Model:     {result['configured_model']}")
-    print(f"  Agent Model:       {result['agent_model']}")
-    print(f"  Agent Autonomy:    {result['model_settings'].get('agentAutonomy', 'N/A')}")
+    print(f"  Primary Model:     {settings['modelSelection']}")
+    print(f"  Agent Model:       {settings['agentModelSelection']}")
+    print(f"  Agent Autonomy:    {settings.get('agentAutonomy', 'N/A')}")
     print()
     
     print("📁 Settings File Location:")
     print(f"  {calculator.settings_path}")
     print()
     
-    if result['configured_model']:
+    if settings['modelSelection']:
         print("✅ Successfully extracted model configuration!")
     else:
         print("⚠️  No model configuration found in settings")
@@ -1,12 +1,108 @@
 """Calculator for activity pattern metrics."""
 
 from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from heapq import nlargest
+from operator import itemgetter
 from typing import Any, Dict, List, Tuple
 
 from ..models import LogEntry
 
 
+def bucket_by_hour(entries: List[LogEntry]) -> Dict[datetime, int]:
+    """Count log entries per clock hour.
+    
+    The hourly buckets feed daily_breakdown_from_buckets and
+    peak_periods_from_buckets. ProjectMetricsCalculator builds the same
+    buckets in its fused pass and reuses those two functions.
+    
+    Args:
+        entries: List of log entries
+        
+    Returns:
+        Dictionary mapping hour-truncated timestamps to entry counts
+    """
+    hour_buckets: Dict[datetime, int] = defaultdict(int)
+    truncate = datetime.replace
+    for entry in entries:
+        hour_buckets[truncate(entry.timestamp, minute=0, second=0, microsecond=0)] += 1
+    return hour_buckets
+
+
+def daily_breakdown_from_buckets(hour_buckets: Dict[datetime, int]) -> Dict[str, int]:
+    """Roll hourly counts up into daily activity counts.
+    
+    Args:
+        hour_buckets: Hour-truncated timestamps mapped to entry counts
+        
+    Returns:
+        Dictionary mapping date strings (YYYY-MM-DD) to activity counts
+    """
+    daily_counts: Dict[date, int] = defaultdict(int)
+    for bucket, count in hour_buckets.items():
+        daily_counts[bucket.date()] += count
+    
+    return {day.isoformat(): count for day, count in daily_counts.items()}
+
+
+def peak_periods_from_buckets(
+    hour_buckets: Dict[datetime, int],
+    window_hours: int = 2,
+    top_n: int = 3
+) -> List[Tuple[datetime, datetime]]:
+    """Identify peak time windows from hourly entry counts.
+    
+    Args:
+        hour_buckets: Hour-truncated timestamps mapped to entry counts
+        window_hours: Size of the time window in hours
+        top_n: Number of peak periods to return
+        
+    Returns:
+        List of tuples (start_time, end_time) for peak periods
+    """
+    if not hour_buckets:
+        return []
+    
+    # Re-key buckets as whole hours since the first bucket. A window
+    # starting at hour k covers buckets k .. k + window_hours - 1, so
+    # window counts are sums of adjacent buckets and the entries are
+    # scanned once instead of once per window.
+    base_time = min(hour_buckets)
+    hour_delta = timedelta(hours=1)
+    hour_counts = {
+        (bucket - base_time) // hour_delta: count
+        for bucket, count in hour_buckets.items()
+    }
+    
+    # Only windows touching a non-empty bucket can have a count > 0
+    window_starts = {
+        hour - offset
+        for hour in hour_counts
+        for offset in range(window_hours)
+        if hour >= offset
+    }
+    
+    # Windows advance in 1-hour steps, so consecutive windows overlap
+    window_delta = timedelta(hours=window_hours)
+    window_counts: List[Tuple[int, int]] = []
+    for hour in sorted(window_starts):
+        count = sum(hour_counts.get(hour + offset, 0) for offset in range(window_hours))
+        window_counts.append((hour, count))
+    
+    # Select the top N by count (descending) without sorting every
+    # window; nlargest matches a stable sort, so ties keep
+    # chronological order
+    top_windows = nlargest(top_n, window_counts, key=itemgetter(1))
+    
+    # Materialize (start, end) datetimes only for the selected windows
+    peak_periods = []
+    for hour, _ in top_windows:
+        start = base_time + hour * hour_delta
+        peak_periods.append((start, start + window_delta))
+    
+    return peak_periods
+
+
 class ActivityPatternCalculator:
     """Calculate activity pattern statistics from log entries.
     
@@ -30,34 +126,21 @@ class ActivityPatternCalculator:
                 'daily_breakdown': {}
             }
         
+        # Read each timestamp once: hourly buckets feed the peak windows,
+        # and the daily breakdown is rolled up from the same buckets
+        hour_buckets = bucket_by_hour(entries)
+        
         # Generate daily breakdown
-        daily_breakdown = self._calculate_daily_breakdown(entries)
+        daily_breakdown = daily_breakdown_from_buckets(hour_buckets)
         
         # Identify peak activity periods (2-hour windows)
-        peak_periods = self._identify_peak_periods(entries)
+        peak_periods = peak_periods_from_buckets(hour_buckets)
         
         return {
             'peak_activity_periods': peak_periods,
             'daily_breakdown': daily_breakdown
         }
     
-    def _calculate_daily_breakdown(self, entries: List[LogEntry]) -> Dict[str, int]:
-        """Generate daily activity counts.
-        
-        Args:
-            entries: List of log entries
-            
-        Returns:
-            Dictionary mapping date strings (YYYY-MM-DD) to activity counts
-        """
-        daily_counts: Dict[str, int] = defaultdict(int)
-        
-        for entry in entries:
-            date_str = entry.timestamp.strftime('%Y-%m-%d')
-            daily_counts[date_str] += 1
-        
-        return dict(daily_counts)
-    
     def _identify_peak_periods(
         self, 
         entries: List[LogEntry], 
@@ -77,40 +160,6 @@ class ActivityPatternCalculator:
         if not entries:
             return []
         
-        # Sort entries by timestamp
-        sorted_entries = sorted(entries, key=lambda e: e.timestamp)
-        
-        # Find the overall time range
-        min_time = sorted_entries[0].timestamp
-        max_time = sorted_entries[-1].timestamp
-        
-        # Create 2-hour windows and count activities
-        window_delta = timedelta(hours=window_hours)
-        window_counts: List[Tuple[datetime, datetime, int]] = []
-        
-        current_time = min_time.replace(minute=0, second=0, microsecond=0)
-        
-        while current_time <= max_time:
-            window_end = current_time + window_delta
-            
-            # Count entries in this window
-            count = sum(
-                1 for entry in sorted_entries
-                if current_time <= entry.timestamp < window_end
-            )
-            
-            if count > 0:
-                window_counts.append((current_time, window_end, count))
-            
-            # Move to next window (1-hour step for overlapping windows)
-            current_time += timedelta(hours=1)
-        
-        # Sort by count (descending) and take top N
-        window_counts.sort(key=lambda x: x[2], reverse=True)
-        
-        # Return top N periods without the count
-        peak_periods = [
-            (start, end) for start, end, _ in window_counts[:top_n]
-        ]
-        
-        return peak_periods
+        return peak_periods_from_buckets(
+            bucket_by_hour(entries), window_hours, top_n
+        )
@@ -1,9 +1,52 @@
 """Calculator for character processing metrics."""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Mapping
 
 from ..models import LogEntry
 
+# Fields holding an explicit character count, in priority order
+CHAR_KEYS = ('character_count', 'characters', 'chars_processed')
+
+# Text fields whose length is used when no explicit count is present
+CONTENT_KEYS = ('content', 'request')
+
+_MISSING = object()
+
+
+def character_count_from_data(data: Mapping[str, Any]) -> int:
+    """Count the characters an entry's data accounts for.
+    
+    Args:
+        data: The entry's data dictionary
+        
+    Returns:
+        The first explicit count present in CHAR_KEYS if it is a positive
+        integer (0 if it is invalid), otherwise the length of the first
+        string in CONTENT_KEYS, otherwise 0
+    """
+    data_get = data.get
+    
+    # Look for character count in various fields; the first field present
+    # wins even if its value is invalid
+    for key in CHAR_KEYS:
+        value = data_get(key, _MISSING)
+        if value is _MISSING:
+            continue
+        try:
+            count = int(value)
+        except (ValueError, TypeError):
+            return 0
+        return count if count > 0 else 0
+    
+    # Also check if there's request content we can count
+    for key in CONTENT_KEYS:
+        value = data_get(key)
+        # Parsed JSON yields exact str instances, so an identity check on
+        # the type is enough and cheaper than isinstance
+        if type(value) is str:
+            return len(value)
+    return 0
+
 
 class CharacterCountCalculator:
     """Calculate total characters processed from log entries.
@@ -22,35 +65,8 @@ class CharacterCountCalculator:
             Dictionary with 'total_characters_processed'
         """
         total_characters = 0
-        
         for entry in entries:
-            # Look for character count in various fields
-            if 'character_count' in entry.data:
-                try:
-                    count = int(entry.data['character_count'])
-                    if count > 0:
-                        total_characters += count
-                except (ValueError, TypeError):
-                    pass
-            elif 'characters' in entry.data:
-                try:
-                    count = int(entry.data['characters'])
-                    if count > 0:
-                        total_characters += count
-                except (ValueError, TypeError):
-                    pass
-            elif 'chars_processed' in entry.data:
-                try:
-                    count = int(entry.data['chars_processed'])
-                    if count > 0:
-                        total_characters += count
-                except (ValueError, TypeError):
-                    pass
-            # Also check if there's request content we can count
-            elif 'content' in entry.data and isinstance(entry.data['content'], str):
-                total_characters += len(entry.data['content'])
-            elif 'request' in entry.data and isinstance(entry.data['request'], str):
-                total_characters += len(entry.data['request'])
+            total_characters += character_count_from_data(entry.data)
         
         return {
             'total_characters_processed': total_characters
@@ -1,9 +1,37 @@
 """Calculator for code generation metrics."""
 
-from typing import Any, Dict, List
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
 
 from ..models import LogEntry
 
+# Statuses counted as failed requests, here and in ProjectMetricsCalculator.
+# A tuple (rather than a set) keeps membership tests on equality, so
+# unhashable status values are tolerated.
+FAILED_STATUSES = ('failed', 'error')
+
+
+def parse_line_count(value: Any) -> Optional[int]:
+    """Convert a logged line count to int.
+    
+    Shared by the code generation metrics of CodeGenerationCalculator and
+    ProjectMetricsCalculator.
+    
+    Args:
+        value: Raw value from a log entry
+        
+    Returns:
+        Integer value, or None if the value cannot be converted
+    """
+    # Parsed JSON almost always yields plain ints; skip the conversion
+    # and the exception handling for them
+    if type(value) is int:
+        return value
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
 
 class CodeGenerationCalculator:
     """Calculate code generation statistics from log entries.
@@ -25,30 +53,29 @@ class CodeGenerationCalculator:
             and 'success_rate_percent'
         """
         total_lines = 0
-        lines_by_language: Dict[str, int] = {}
+        # defaultdict's missing-key path runs in C, unlike Counter's
+        lines_by_language: Dict[str, int] = defaultdict(int)
         successful_requests = 0
         failed_requests = 0
         
         for entry in entries:
+            data = entry.data
+            
             # Count lines of code generated
-            if 'lines_generated' in entry.data:
-                try:
-                    lines = int(entry.data['lines_generated'])
-                    if lines > 0:
-                        total_lines += lines
-                        
-                        # Categorize by language if available
-                        language = entry.data.get('language', 'unknown')
-                        lines_by_language[language] = lines_by_language.get(language, 0) + lines
-                except (ValueError, TypeError):
-                    pass
+            lines = parse_line_count(data.get('lines_generated'))
+            if lines is not None and lines > 0:
+                total_lines += lines
+                
+                # Categorize by language if available
+                language = data.get('language', 'unknown')
+                lines_by_language[language] += lines
             
             # Track success/failure for success rate calculation
             if entry.event_type == 'request':
-                status = entry.data.get('status', '')
-                if status == 'success' or entry.data.get('success', False):
+                status = data.get('status', '')
+                if status == 'success' or data.get('success', False):
                     successful_requests += 1
-                elif status == 'failed' or status == 'error' or entry.data.get('failed', False):
+                elif status in FAILED_STATUSES or data.get('failed', False):
                     failed_requests += 1
         
         # Calculate success rate
@@ -60,6 +87,6 @@ class CodeGenerationCalculator:
         
         return {
             'lines_of_code_generated': total_lines,
-            'lines_by_language': lines_by_language,
+            'lines_by_language': dict(lines_by_language),
             'success_rate_percent': success_rate
         }
@@ -1,12 +1,66 @@
 """Calculator for LLM model usage metrics."""
 
 import json
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from ..models import LogEntry
 
 
+@lru_cache(maxsize=8)
+def _load_settings(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """Read and parse a settings.json file.
+    
+    Cached on the file's modification time so repeated calculations (for
+    example one per project) parse the file once until it changes.
+    
+    Args:
+        path_str: Path to the settings file
+        mtime_ns: Modification time of the file, used only as a cache key
+        
+    Returns:
+        Parsed settings dictionary
+    """
+    return json.loads(Path(path_str).read_bytes())
+
+
+def model_name_from_data(data: Dict[str, Any]) -> Optional[str]:
+    """Find the model name recorded in a log entry's data.
+    
+    Shared by ModelUsageCalculator and ProjectMetricsCalculator.
+    
+    Args:
+        data: Structured data of a log entry
+        
+    Returns:
+        Model name, or None if the entry has no model information
+    """
+    model_name = None
+    
+    # Look for model information in various fields
+    if 'model' in data:
+        model_name = data['model']
+    elif 'model_name' in data:
+        model_name = data['model_name']
+    elif 'llm_model' in data:
+        model_name = data['llm_model']
+    elif 'ai_model' in data:
+        model_name = data['ai_model']
+    
+    # Also check nested context
+    if not model_name and 'context' in data:
+        context = data['context']
+        try:
+            model_name = context.get('model') or context.get('model_name')
+        except AttributeError:
+            # Context is not a mapping (e.g. a plain string)
+            pass
+    
+    return model_name
+
+
 class ModelUsageCalculator:
     """Calculate LLM model usage statistics.
     
@@ -40,10 +94,10 @@ class ModelUsageCalculator:
             - 'model_settings': Full model-related settings
         """
         # Extract configured model from settings
-        model_settings = self._extract_model_from_settings()
+        model_settings = self.read_settings()
         
-        # Track model usage from log entries
-        models_used = self._track_model_usage_from_logs(entries)
+        # Track model usage from log entries (nothing to scan without entries)
+        models_used = self._track_model_usage_from_logs(entries) if entries else {}
         
         return {
             'configured_model': model_settings.get('modelSelection'),
@@ -52,9 +106,12 @@ class ModelUsageCalculator:
             'model_settings': model_settings
         }
     
-    def _extract_model_from_settings(self) -> Dict[str, Any]:
+    def read_settings(self) -> Dict[str, Any]:
         """Extract model configuration from Kiro settings.json.
         
+        Use this instead of ``calculate([])`` when only the configured
+        models are needed and there are no log entries to analyze.
+        
         Returns:
             Dictionary with model-related settings
         """
@@ -66,8 +123,8 @@ class ModelUsageCalculator:
         
         try:
             if self.settings_path.exists():
-                with open(self.settings_path, 'r') as f:
-                    settings = json.load(f)
+                mtime_ns = self.settings_path.stat().st_mtime_ns
+                settings = _load_settings(str(self.settings_path), mtime_ns)
                 
                 # Extract model selection settings
                 if 'kiroAgent.modelSelection' in settings:
@@ -94,28 +151,5 @@ class ModelUsageCalculator:
         Returns:
             Dictionary mapping model names to usage counts
         """
-        model_counts: Dict[str, int] = {}
-        
-        for entry in entries:
-            # Look for model information in various fields
-            model_name = None
-            
-            if 'model' in entry.data:
-                model_name = entry.data['model']
-            elif 'model_name' in entry.data:
-                model_name = entry.data['model_name']
-            elif 'llm_model' in entry.data:
-                model_name = entry.data['llm_model']
-            elif 'ai_model' in entry.data:
-                model_name = entry.data['ai_model']
-            
-            # Also check nested context
-            if not model_name and 'context' in entry.data:
-                context = entry.data['context']
-                if isinstance(context, dict):
-                    model_name = context.get('model') or context.get('model_name')
-            
-            if model_name:
-                model_counts[model_name] = model_counts.get(model_name, 0) + 1
-        
-        return model_counts
+        model_names = (model_name_from_data(entry.data) for entry in entries)
+        return dict(Counter(filter(None, model_names)))
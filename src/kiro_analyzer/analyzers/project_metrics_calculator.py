@@ -1,34 +1,29 @@
 """Calculator for project-level metrics."""
 
 from collections import defaultdict
+from datetime import datetime
 from typing import Any, Dict, List
 
 from ..models import LogEntry
 from ..utils import ProjectExtractor
-from .activity_pattern_calculator import ActivityPatternCalculator
-from .character_count_calculator import CharacterCountCalculator
-from .code_generation_calculator import CodeGenerationCalculator
-from .model_usage_calculator import ModelUsageCalculator
-from .request_count_calculator import RequestCountCalculator
-from .response_time_calculator import ResponseTimeCalculator
-from .tool_usage_calculator import ToolUsageCalculator
+from .activity_pattern_calculator import daily_breakdown_from_buckets, peak_periods_from_buckets
+from .character_count_calculator import character_count_from_data
+from .code_generation_calculator import FAILED_STATUSES, parse_line_count
+from .model_usage_calculator import ModelUsageCalculator, model_name_from_data
+from .response_time_calculator import response_time_from_data, response_time_metrics
 
 
 class ProjectMetricsCalculator:
     """Calculate metrics grouped by project.
     
     This calculator groups log entries by project and computes
-    all standard metrics for each project separately.
+    all standard metrics for each project separately. The per-entry
+    metrics of the standard calculators are computed in a single fused
+    pass over each project's entries rather than one pass per calculator.
     """
     
     def __init__(self):
-        """Initialize with all standard calculators."""
-        self.request_calculator = RequestCountCalculator()
-        self.response_calculator = ResponseTimeCalculator()
-        self.code_calculator = CodeGenerationCalculator()
-        self.tool_calculator = ToolUsageCalculator()
-        self.activity_calculator = ActivityPatternCalculator()
-        self.character_calculator = CharacterCountCalculator()
+        """Initialize with the calculator used outside the fused pass."""
         self.model_calculator = ModelUsageCalculator()
     
     def calculate(self, entries: List[LogEntry]) -> Dict[str, Any]:
@@ -39,7 +34,8 @@ class ProjectMetricsCalculator:
             
         Returns:
             Dictionary with:
-            - 'projects': List of project names
+            - 'projects': List of project names in first-seen order
+              (sort at display time if an ordered listing is needed)
             - 'project_metrics': Dict mapping project names to their metrics
             - 'project_summary': Dict with project activity counts
         """
@@ -60,7 +56,7 @@ class ProjectMetricsCalculator:
             }
         
         return {
-            'projects': sorted(entries_by_project.keys()),
+            'projects': list(entries_by_project),
             'project_metrics': project_metrics,
             'project_summary': project_summary
         }
@@ -88,33 +84,100 @@ class ProjectMetricsCalculator:
     def _calculate_project_metrics(self, entries: List[LogEntry]) -> Dict[str, Any]:
         """Calculate all metrics for a single project.
         
+        Produces the same keys and values as running RequestCountCalculator,
+        ResponseTimeCalculator, CodeGenerationCalculator, ToolUsageCalculator,
+        ActivityPatternCalculator, CharacterCountCalculator and
+        ModelUsageCalculator one after another, but walks the entries once.
+        
         Args:
             entries: Log entries for a specific project
             
         Returns:
             Dictionary containing all calculated metrics
         """
-        metrics = {}
-        
-        # Request counts
-        metrics.update(self.request_calculator.calculate(entries))
-        
-        # Response times
-        metrics.update(self.response_calculator.calculate(entries))
-        
-        # Code generation
-        metrics.update(self.code_calculator.calculate(entries))
+        total_requests = 0
+        total_conversations = 0
+        response_times: List[float] = []
+        total_lines = 0
+        lines_by_language: Dict[str, int] = defaultdict(int)
+        successful_requests = 0
+        failed_requests = 0
+        tool_usage: Dict[str, int] = defaultdict(int)
+        hour_buckets: Dict[datetime, int] = defaultdict(int)
+        total_characters = 0
+        model_counts: Dict[str, int] = defaultdict(int)
         
-        # Tool usage
-        metrics.update(self.tool_calculator.calculate(entries))
-        
-        # Activity patterns
-        metrics.update(self.activity_calculator.calculate(entries))
+        for entry in entries:
+            data = entry.data
+            event_type = entry.event_type
+            
+            # Request counts
+            if event_type == 'request':
+                total_requests += 1
+            elif event_type == 'conversation_start':
+                total_conversations += 1
+            
+            # Response times
+            response_time = response_time_from_data(data)
+            if response_time is not None:
+                response_times.append(response_time)
+            
+            # Code generation
+            lines = parse_line_count(data.get('lines_generated'))
+            if lines is not None and lines > 0:
+                total_lines += lines
+                language = data.get('language', 'unknown')
+                lines_by_language[language] += lines
+            
+            if event_type == 'request':
+                status = data.get('status', '')
+                if status == 'success' or data.get('success', False):
+                    successful_requests += 1
+                elif status in FAILED_STATUSES or data.get('failed', False):
+                    failed_requests += 1
+            
+            # Tool usage
+            if event_type == 'tool_invocation':
+                tool_name = data.get('tool_name') or data.get('tool')
+                if tool_name:
+                    tool_usage[tool_name] += 1
+            elif 'tool' in data:
+                tool_name = data['tool']
+                if tool_name:
+                    tool_usage[tool_name] += 1
+            
+            # Activity patterns (daily and peak windows share hourly buckets)
+            hour_buckets[entry.timestamp.replace(minute=0, second=0, microsecond=0)] += 1
+            
+            # Character counts
+            total_characters += character_count_from_data(data)
+            
+            # Model usage
+            model_name = model_name_from_data(data)
+            if model_name:
+                model_counts[model_name] += 1
         
-        # Character counts
-        metrics.update(self.character_calculator.calculate(entries))
+        total_tracked_requests = successful_requests + failed_requests
+        if total_tracked_requests > 0:
+            success_rate = (successful_requests / total_tracked_requests) * 100
+        else:
+            success_rate = 0.0
         
-        # Model usage
-        metrics.update(self.model_calculator.calculate(entries))
+        model_settings = self.model_calculator.read_settings()
         
-        return metrics
+        return {
+            'total_requests': total_requests,
+            'total_conversations': total_conversations,
+            **response_time_metrics(response_times),
+            'lines_of_code_generated': total_lines,
+            'lines_by_language': dict(lines_by_language),
+            'success_rate_percent': success_rate,
+            'tool_usage': dict(tool_usage),
+            'peak_activity_periods': peak_periods_from_buckets(hour_buckets),
+            'daily_breakdown': daily_breakdown_from_buckets(hour_buckets),
+            'total_characters_processed': total_characters,
+            'configured_model': model_settings.get('modelSelection'),
+            'agent_model': model_settings.get('agentModelSelection'),
+            'models_used': dict(model_counts),
+            'model_settings': model_settings
+        }
@@ -26,9 +26,10 @@ class RequestCountCalculator:
         total_conversations = 0
         
         for entry in entries:
-            if entry.event_type == 'request':
+            event_type = entry.event_type
+            if event_type == 'request':
                 total_requests += 1
-            elif entry.event_type == 'conversation_start':
+            elif event_type == 'conversation_start':
                 total_conversations += 1
         
         return {
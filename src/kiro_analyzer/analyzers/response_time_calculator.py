@@ -1,10 +1,68 @@
 """Calculator for response time metrics."""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Mapping, Optional
 
 from ..models import LogEntry
 
 
+def response_time_from_data(data: Mapping[str, Any]) -> Optional[float]:
+    """Extract a valid response time from an entry's data.
+    
+    Shared with ProjectMetricsCalculator, which must read response times
+    the same way.
+    
+    Args:
+        data: The entry's data dictionary
+        
+    Returns:
+        Response time in seconds, or None if absent, not numeric, negative
+        or NaN
+    """
+    # Look for response time in the data field
+    if 'response_time' in data:
+        value = data['response_time']
+    elif 'response_time_seconds' in data:
+        value = data['response_time_seconds']
+    else:
+        return None
+    
+    try:
+        response_time = float(value)
+    except (ValueError, TypeError):
+        # Skip invalid response time data
+        return None
+    
+    if not response_time >= 0:  # Validate non-negative (also rejects NaN)
+        return None
+    return response_time
+
+
+def response_time_metrics(response_times: List[float]) -> Dict[str, float]:
+    """Summarize valid response times.
+    
+    Args:
+        response_times: Values returned by response_time_from_data
+        
+    Returns:
+        Dictionary with 'avg_response_time_seconds',
+        'fastest_response_time_seconds', and 'slowest_response_time_seconds',
+        all 0.0 when no values are given
+    """
+    if not response_times:
+        # Default to 0.0 when no valid data was found
+        return {
+            'avg_response_time_seconds': 0.0,
+            'fastest_response_time_seconds': 0.0,
+            'slowest_response_time_seconds': 0.0
+        }
+    
+    return {
+        'avg_response_time_seconds': sum(response_times) / len(response_times),
+        'fastest_response_time_seconds': min(response_times),
+        'slowest_response_time_seconds': max(response_times)
+    }
+
+
 class ResponseTimeCalculator:
     """Calculate response time statistics from agentic mode operations.
     
@@ -28,37 +86,9 @@ class ResponseTimeCalculator:
             'fastest_response_time_seconds', and 'slowest_response_time_seconds'
         """
         response_times = []
-        
         for entry in entries:
-            # Look for response time in the data field
-            if 'response_time' in entry.data:
-                try:
-                    response_time = float(entry.data['response_time'])
-                    if response_time >= 0:  # Validate non-negative
-                        response_times.append(response_time)
-                except (ValueError, TypeError):
-                    # Skip invalid response time data
-                    continue
-            elif 'response_time_seconds' in entry.data:
-                try:
-                    response_time = float(entry.data['response_time_seconds'])
-                    if response_time >= 0:
-                        response_times.append(response_time)
-                except (ValueError, TypeError):
-                    continue
-        
-        # Calculate statistics or return defaults if no valid data
-        if response_times:
-            avg_response_time = sum(response_times) / len(response_times)
-            fastest_response_time = min(response_times)
-            slowest_response_time = max(response_times)
-        else:
-            avg_response_time = 0.0
-            fastest_response_time = 0.0
-            slowest_response_time = 0.0
+            response_time = response_time_from_data(entry.data)
+            if response_time is not None:
+                response_times.append(response_time)
         
-        return {
-            'avg_response_time_seconds': avg_response_time,
-            'fastest_response_time_seconds': fastest_response_time,
-            'slowest_response_time_seconds': slowest_response_time
-        }
+        return response_time_metrics(response_times)
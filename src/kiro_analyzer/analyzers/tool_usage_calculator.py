@@ -1,5 +1,6 @@
 """Calculator for tool usage metrics."""
 
+from collections import Counter
 from typing import Any, Dict, List
 
 from ..models import LogEntry
@@ -22,21 +23,18 @@ class ToolUsageCalculator:
         Returns:
             Dictionary with 'tool_usage' mapping tool names to counts
         """
-        tool_usage: Dict[str, int] = {}
+        # Tool invocations name the tool in 'tool_name' or 'tool'; other
+        # event types may also carry tool information in 'tool'
+        tool_names = (
+            (entry.data.get('tool_name') or entry.data.get('tool'))
+            if entry.event_type == 'tool_invocation'
+            else entry.data.get('tool')
+            for entry in entries
+        )
         
-        for entry in entries:
-            # Look for tool invocations
-            if entry.event_type == 'tool_invocation':
-                tool_name = entry.data.get('tool_name') or entry.data.get('tool')
-                if tool_name:
-                    tool_usage[tool_name] = tool_usage.get(tool_name, 0) + 1
-            
-            # Also check for tool information in other event types
-            elif 'tool' in entry.data:
-                tool_name = entry.data['tool']
-                if tool_name:
-                    tool_usage[tool_name] = tool_usage.get(tool_name, 0) + 1
+        # Counter consumes the iterable in C; empty/missing names are dropped
+        tool_usage = Counter(filter(None, tool_names))
         
         return {
-            'tool_usage': tool_usage
+            'tool_usage': dict(tool_usage)
         }
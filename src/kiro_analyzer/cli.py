@@ -1,25 +1,53 @@
 """Main CLI entry point for Kiro Activity Analyzer."""
 
 import click
+import re
 import sys
 from datetime import datetime, timedelta
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
 from kiro_analyzer import __version__
+from kiro_analyzer.models import AnalyzerConfig
 from kiro_analyzer.services.config_manager import ConfigManager
 from kiro_analyzer.services.log_discovery import LogDiscoveryService
-from kiro_analyzer.parsers.parser_service import ParserService
-from kiro_analyzer.services.analyzer_service import AnalyzerService
-from kiro_analyzer.reporters.reporter_service import ReporterService, ReportFormat
-from kiro_analyzer.analyzers import (
-    ActivityPatternCalculator,
-    CharacterCountCalculator,
-    CodeGenerationCalculator,
-    RequestCountCalculator,
-    ResponseTimeCalculator,
-    ToolUsageCalculator,
-)
+
+# The analysis pipeline (parsers, calculators, rich reporting) is imported
+# inside the analyze/report commands, so that --version, discover and
+# show-patterns start without loading it.
+
+
+# Report period: <number><unit>, e.g. 12h, 7d, 2w, 3m
+_PERIOD_RE = re.compile(r'^(\d+)([hdwm])$')
+
+# Period unit -> (timedelta keyword, multiplier); a month counts as 30 days
+_PERIOD_UNITS = {
+    'h': ('hours', 1),
+    'd': ('days', 1),
+    'w': ('weeks', 1),
+    'm': ('days', 30),
+}
+
+
+def _get_config(ctx: click.Context) -> AnalyzerConfig:
+    """Load the analyzer configuration once per CLI context.
+    
+    The loaded config is stored on ``ctx.obj`` so commands invoked within
+    the same context (e.g. programmatically) share one load.
+    
+    Args:
+        ctx: Click context carrying the ``--config`` path
+        
+    Returns:
+        AnalyzerConfig for this invocation
+    """
+    config = ctx.obj.get("config_obj")
+    if config is None:
+        config = ConfigManager(ctx.obj.get("config")).load_config()
+        ctx.obj["config_obj"] = config
+    return config
 
 
 @click.group()
@@ -87,13 +115,19 @@ def version() -> None:
     type=click.Path(path_type=Path),
     help="Custom path to save the report"
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Re-parse all log files instead of reusing cached parse results"
+)
 @click.pass_context
 def analyze(
     ctx: click.Context,
     start_date: Optional[datetime],
     end_date: Optional[datetime],
     output_format: str,
-    output_path: Optional[Path]
+    output_path: Optional[Path],
+    no_cache: bool
 ) -> None:
     """Analyze Kiro logs for a specified time period.
     
@@ -111,13 +145,13 @@ def analyze(
         # Generate JSON report
         kiro-analyzer analyze --output-format json --output-path report.json
     """
+    from kiro_analyzer.pipeline import EmptyAnalysisError, run_pipeline
+    
     verbose = ctx.obj.get("verbose", False)
-    config_path = ctx.obj.get("config")
     
     try:
         # Load configuration
-        config_manager = ConfigManager(config_path)
-        config = config_manager.load_config()
+        config = _get_config(ctx)
         
         # Set default date range if not specified
         if end_date is None:
@@ -129,82 +163,15 @@ def analyze(
             click.echo(f"Analyzing logs from {start_date.date()} to {end_date.date()}")
             click.echo(f"Kiro application folder: {config.kiro_app_folder}")
         
-        # Step 1: Discover log files
-        discovery_service = LogDiscoveryService(config.kiro_app_folder)
-        log_files = discovery_service.discover_logs(
-            base_path=config.kiro_app_folder,
-            start_date=start_date,
-            end_date=end_date
-        )
-        
-        if not log_files:
-            click.echo(
-                f"No log files found in {config.kiro_app_folder} "
-                f"for the period {start_date.date()} to {end_date.date()}",
-                err=True
-            )
-            sys.exit(1)
-        
-        if verbose:
-            click.echo(f"Discovered {len(log_files)} log files")
-        
-        # Step 2: Parse log files
-        parser_service = ParserService()
-        log_entries = parser_service.parse_files([f.path for f in log_files])
-        
-        if not log_entries:
-            click.echo(
-                "No log entries could be parsed from the discovered files",
-                err=True
-            )
-            sys.exit(1)
-        
-        if verbose:
-            click.echo(f"Parsed {len(log_entries)} log entries")
-        
-        # Step 3: Analyze log entries
-        calculators = [
-            RequestCountCalculator(),
-            ResponseTimeCalculator(),
-            CodeGenerationCalculator(),
-            CharacterCountCalculator(),
-            ToolUsageCalculator(),
-            ActivityPatternCalculator(),
-        ]
-        
-        analyzer_service = AnalyzerService(calculators)
-        
-        # Filter entries by date range
-        filtered_entries = analyzer_service.filter_by_date_range(
-            log_entries,
+        report_content, output_path = run_pipeline(
+            config,
             start_date,
-            end_date
-        )
-        
-        if verbose:
-            click.echo(f"Analyzing {len(filtered_entries)} entries within date range")
-        
-        metrics = analyzer_service.analyze(
-            filtered_entries,
-            analysis_period=(start_date, end_date)
-        )
-        
-        # Step 4: Generate report
-        reporter_service = ReporterService()
-        format_enum = ReportFormat(output_format.lower())
-        
-        # Determine output path
-        if output_path is None and output_format != "console":
-            output_path = reporter_service.generate_timestamped_filename(
-                "kiro_analysis",
-                format_enum,
-                config.output_directory
-            )
-        
-        report_content = reporter_service.generate_report(
-            metrics,
-            format_enum,
-            output_path
+            end_date,
+            output_format,
+            output_path=output_path,
+            report_name="kiro_analysis",
+            use_cache=not no_cache,
+            progress=click.echo if verbose else None
         )
         
         # Display or save results
@@ -215,6 +182,9 @@ def analyze(
             if verbose:
                 click.echo(f"Report format: {output_format}")
         
+    except EmptyAnalysisError as e:
+        click.echo(str(e), err=True)
+        sys.exit(1)
     except FileNotFoundError as e:
         click.echo(f"Error: {e}", err=True)
         click.echo(
@@ -259,12 +229,10 @@ def discover(ctx: click.Context, directory: Optional[Path]) -> None:
         kiro-analyzer discover --directory /path/to/logs
     """
     verbose = ctx.obj.get("verbose", False)
-    config_path = ctx.obj.get("config")
     
     try:
         # Load configuration
-        config_manager = ConfigManager(config_path)
-        config = config_manager.load_config()
+        config = _get_config(ctx)
         
         # Use custom directory if provided, otherwise use config
         search_path = directory or config.kiro_app_folder
@@ -283,17 +251,16 @@ def discover(ctx: click.Context, directory: Optional[Path]) -> None:
         # Display results
         click.echo(f"\nDiscovered {len(log_files)} log files:\n")
         
-        # Group by file type
-        by_type = {}
-        for log_file in log_files:
-            if log_file.file_type not in by_type:
-                by_type[log_file.file_type] = []
-            by_type[log_file.file_type].append(log_file)
+        # Order by file type, newest first within each type. Both sorts are
+        # stable, so the second keeps the modification order within a type.
+        log_files = sorted(log_files, key=attrgetter('modified_at'), reverse=True)
+        log_files.sort(key=attrgetter('file_type'))
         
         # Display grouped results
-        for file_type, files in sorted(by_type.items()):
+        for file_type, group in groupby(log_files, key=attrgetter('file_type')):
+            files = list(group)
             click.echo(f"[{file_type.upper()}] ({len(files)} files)")
-            for log_file in sorted(files, key=lambda f: f.modified_at, reverse=True):
+            for log_file in files:
                 size_kb = log_file.size_bytes / 1024
                 modified = log_file.modified_at.strftime("%Y-%m-%d %H:%M:%S")
                 click.echo(f"  • {log_file.path.name}")
@@ -325,7 +292,7 @@ def discover(ctx: click.Context, directory: Optional[Path]) -> None:
     "--period",
     type=str,
     default="7d",
-    help="Time period for analysis (e.g., 7d, 30d, 90d)"
+    help="Time period for analysis (e.g., 12h, 7d, 2w, 3m)"
 )
 @click.option(
     "--output",
@@ -339,17 +306,24 @@ def discover(ctx: click.Context, directory: Optional[Path]) -> None:
     default="console",
     help="Output format for the report"
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Re-parse all log files instead of reusing cached parse results"
+)
 @click.pass_context
 def report(
     ctx: click.Context,
     period: str,
     output: Optional[Path],
-    output_format: str
+    output_format: str,
+    no_cache: bool
 ) -> None:
     """Generate a full metrics report for a specified period.
     
-    This command converts a period specification (like '7d', '30d', '90d')
-    into a date range and generates a comprehensive metrics report.
+    This command converts a period specification (like '12h', '7d', '2w',
+    '3m', where a month is 30 days) into a date range and generates a
+    comprehensive metrics report.
     
     Examples:
     
@@ -362,107 +336,41 @@ def report(
         # Generate 90-day report
         kiro-analyzer report --period 90d
     """
+    from kiro_analyzer.pipeline import EmptyAnalysisError, run_pipeline
+    
     verbose = ctx.obj.get("verbose", False)
     
     try:
-        # Parse period string (e.g., "7d", "30d", "90d")
-        if not period.endswith('d'):
+        # Parse period string (e.g., "12h", "7d", "2w", "3m")
+        match = _PERIOD_RE.match(period)
+        if not match:
             click.echo(
                 f"Error: Invalid period format '{period}'. "
-                "Expected format: <number>d (e.g., 7d, 30d, 90d)",
+                "Expected format: <number><h|d|w|m> (e.g., 12h, 7d, 2w, 3m)",
                 err=True
             )
             sys.exit(1)
         
-        try:
-            days = int(period[:-1])
-        except ValueError:
-            click.echo(
-                f"Error: Invalid period format '{period}'. "
-                "Expected format: <number>d (e.g., 7d, 30d, 90d)",
-                err=True
-            )
-            sys.exit(1)
+        unit, multiplier = _PERIOD_UNITS[match[2]]
         
         # Convert period to date range
         end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
+        start_date = end_date - timedelta(**{unit: int(match[1]) * multiplier})
         
         if verbose:
             click.echo(f"Generating report for period: {period} ({start_date.date()} to {end_date.date()})")
         
-        # Use the analyze command logic
-        config_path = ctx.obj.get("config")
-        config_manager = ConfigManager(config_path)
-        config = config_manager.load_config()
-        
-        # Step 1: Discover log files
-        discovery_service = LogDiscoveryService(config.kiro_app_folder)
-        log_files = discovery_service.discover_logs(
-            base_path=config.kiro_app_folder,
-            start_date=start_date,
-            end_date=end_date
-        )
+        config = _get_config(ctx)
         
-        if not log_files:
-            click.echo(
-                f"No log files found for the period {start_date.date()} to {end_date.date()}",
-                err=True
-            )
-            sys.exit(1)
-        
-        if verbose:
-            click.echo(f"Discovered {len(log_files)} log files")
-        
-        # Step 2: Parse log files
-        parser_service = ParserService()
-        log_entries = parser_service.parse_files([f.path for f in log_files])
-        
-        if not log_entries:
-            click.echo("No log entries could be parsed", err=True)
-            sys.exit(1)
-        
-        if verbose:
-            click.echo(f"Parsed {len(log_entries)} log entries")
-        
-        # Step 3: Analyze log entries
-        calculators = [
-            RequestCountCalculator(),
-            ResponseTimeCalculator(),
-            CodeGenerationCalculator(),
-            CharacterCountCalculator(),
-            ToolUsageCalculator(),
-            ActivityPatternCalculator(),
-        ]
-        
-        analyzer_service = AnalyzerService(calculators)
-        filtered_entries = analyzer_service.filter_by_date_range(
-            log_entries,
+        report_content, output = run_pipeline(
+            config,
             start_date,
-            end_date
-        )
-        
-        metrics = analyzer_service.analyze(
-            filtered_entries,
-            analysis_period=(start_date, end_date)
-        )
-        
-        # Step 4: Generate report
-        reporter_service = ReporterService()
-        format_enum = ReportFormat(output_format.lower())
-        
-        # Determine output path
-        if output is None and output_format != "console":
-            output = reporter_service.generate_timestamped_filename(
-                f"kiro_report_{period}",
-                format_enum,
-                config.output_directory
-            )
-        
-        report_content = reporter_service.generate_report(
-            metrics,
-            format_enum,
-            output
+            end_date,
+            output_format,
+            output_path=output,
+            report_name=f"kiro_report_{period}",
+            use_cache=not no_cache,
+            progress=click.echo if verbose else None
         )
         
         # Display or save results
@@ -471,6 +379,9 @@ def report(
         else:
             click.echo(f"Report saved to: {output}")
         
+    except EmptyAnalysisError as e:
+        click.echo(str(e), err=True)
+        sys.exit(1)
     except Exception as e:
         click.echo(f"Error generating report: {e}", err=True)
         if verbose:
@@ -494,9 +405,8 @@ def show_patterns(ctx: click.Context) -> None:
     verbose = ctx.obj.get("verbose", False)
     
     try:
-        # Get log patterns from discovery service
-        discovery_service = LogDiscoveryService()
-        patterns = discovery_service.get_log_patterns()
+        # Get log patterns (no discovery service instance needed)
+        patterns = LogDiscoveryService.get_log_patterns()
         
         click.echo("\nRecognized Log File Patterns:\n")
         click.echo("=" * 70)
@@ -3,7 +3,7 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Optional
+from typing import Any, Dict, Iterator, List, Tuple, Optional
 
 
 @dataclass
@@ -17,6 +17,10 @@ class LogEntry:
         raw_line: Original unparsed log line
         source_file: Path to the log file this entry came from
     """
+    # Explicit slots drop the per-instance __dict__; parsing can create
+    # millions of entries. (dataclass(slots=True) needs Python 3.10.)
+    __slots__ = ('timestamp', 'event_type', 'data', 'raw_line', 'source_file')
+    
     timestamp: datetime
     event_type: str
     data: Dict[str, Any]
@@ -35,6 +39,8 @@ class LogFileMetadata:
         created_at: File creation timestamp
         modified_at: File last modification timestamp
     """
+    __slots__ = ('path', 'file_type', 'size_bytes', 'created_at', 'modified_at')
+    
     path: Path
     file_type: str
     size_bytes: int
@@ -103,48 +109,55 @@ class ProductivityMetrics:
             "daily_breakdown": self.daily_breakdown
         }
     
-    def to_csv_rows(self) -> List[Dict[str, Any]]:
-        """Convert metrics to rows for CSV output.
+    def iter_csv_rows(self) -> Iterator[Dict[str, Any]]:
+        """Yield metrics as rows for CSV output.
         
-        Returns:
-            List of dictionaries with metric_name, value, and unit columns
+        Rows are produced lazily so a CSV writer can stream them without
+        the full list being held in memory.
+        
+        Yields:
+            Dictionaries with metric_name, value, and unit columns
         """
-        rows = [
-            {"metric_name": "total_requests", "value": self.total_requests, "unit": "count"},
-            {"metric_name": "total_conversations", "value": self.total_conversations, "unit": "count"},
-            {"metric_name": "avg_response_time", "value": self.avg_response_time_seconds, "unit": "seconds"},
-            {"metric_name": "fastest_response_time", "value": self.fastest_response_time_seconds, "unit": "seconds"},
-            {"metric_name": "slowest_response_time", "value": self.slowest_response_time_seconds, "unit": "seconds"},
-            {"metric_name": "total_characters_processed", "value": self.total_characters_processed, "unit": "characters"},
-            {"metric_name": "lines_of_code_generated", "value": self.lines_of_code_generated, "unit": "lines"},
-            {"metric_name": "success_rate", "value": self.success_rate_percent, "unit": "percent"},
-        ]
+        yield {"metric_name": "total_requests", "value": self.total_requests, "unit": "count"}
+        yield {"metric_name": "total_conversations", "value": self.total_conversations, "unit": "count"}
+        yield {"metric_name": "avg_response_time", "value": self.avg_response_time_seconds, "unit": "seconds"}
+        yield {"metric_name": "fastest_response_time", "value": self.fastest_response_time_seconds, "unit": "seconds"}
+        yield {"metric_name": "slowest_response_time", "value": self.slowest_response_time_seconds, "unit": "seconds"}
+        yield {"metric_name": "total_characters_processed", "value": self.total_characters_processed, "unit": "characters"}
+        yield {"metric_name": "lines_of_code_generated", "value": self.lines_of_code_generated, "unit": "lines"}
+        yield {"metric_name": "success_rate", "value": self.success_rate_percent, "unit": "percent"}
         
         # Add lines by language as separate rows
         for language, count in self.lines_by_language.items():
-            rows.append({
+            yield {
                 "metric_name": f"lines_of_code_{language}",
                 "value": count,
                 "unit": "lines"
-            })
+            }
         
         # Add tool usage as separate rows
         for tool_name, count in self.tool_usage.items():
-            rows.append({
+            yield {
                 "metric_name": f"tool_usage_{tool_name}",
                 "value": count,
                 "unit": "count"
-            })
+            }
         
         # Add daily breakdown as separate rows
         for date_str, count in self.daily_breakdown.items():
-            rows.append({
+            yield {
                 "metric_name": f"daily_activity_{date_str}",
                 "value": count,
                 "unit": "count"
-            })
+            }
+    
+    def to_csv_rows(self) -> List[Dict[str, Any]]:
+        """Convert metrics to rows for CSV output.
         
-        return rows
+        Returns:
+            List of dictionaries with metric_name, value, and unit columns
+        """
+        return list(self.iter_csv_rows())
 
 
 @dataclass
@@ -157,9 +170,13 @@ class AnalyzerConfig:
         output_directory: Directory where reports should be saved
         enabled_metrics: List of metric names to calculate (empty = all)
         custom_parsers: List of custom parser class paths to load
+        n_workers: Number of processes used to parse log files (1 = serial)
+        chunksize: Number of files handed to a parser process at a time
     """
     kiro_app_folder: Path
     default_date_range_days: int = 7
     output_directory: Path = field(default_factory=lambda: Path.home() / ".kiro-analyzer" / "reports")
     enabled_metrics: List[str] = field(default_factory=list)
     custom_parsers: List[str] = field(default_factory=list)
+    n_workers: int = 1
+    chunksize: int = 1
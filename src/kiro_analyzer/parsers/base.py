@@ -1,10 +1,17 @@
 """Base utilities for log parsing."""
 
+import mmap
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Iterator, List, Optional, Tuple, Union
 
 
-def stream_file_lines(file_path: Path, encoding: str = 'utf-8', chunk_size: int = 8192) -> Iterator[str]:
+def stream_file_lines(
+    file_path: Path,
+    encoding: str = 'utf-8',
+    chunk_size: int = 1 << 20,
+    *,
+    binary: bool = False
+) -> Iterator[Union[str, bytes]]:
     """Stream lines from a file efficiently for large files.
     
     This function reads files line-by-line without loading the entire file
@@ -13,7 +20,12 @@ def stream_file_lines(file_path: Path, encoding: str = 'utf-8', chunk_size: int
     Args:
         file_path: Path to the file to read
         encoding: Character encoding of the file (default: utf-8)
-        chunk_size: Size of read buffer in bytes (default: 8192)
+        chunk_size: Size of read buffer in bytes (default: 1 MiB). A large
+                   buffer amortizes read syscalls over many lines
+        binary: Yield undecoded bytes lines instead of str, for callers
+               that decode lazily or hand bytes straight to a decoder.
+               Binary lines end only at '\n'; text lines also end at a
+               lone '\r', as with Python's universal newlines
         
     Yields:
         Individual lines from the file (without newline characters)
@@ -22,11 +34,92 @@ def stream_file_lines(file_path: Path, encoding: str = 'utf-8', chunk_size: int
         IOError: If the file cannot be read
         UnicodeDecodeError: If the file encoding is incorrect
     """
+    if binary:
+        with open(file_path, 'rb', buffering=chunk_size) as f:
+            for line in f:
+                yield line.rstrip(b'\n\r')
+        return
+    
     with open(file_path, 'r', encoding=encoding, buffering=chunk_size) as f:
         for line in f:
             yield line.rstrip('\n\r')
 
 
+def iter_byte_chunks(file_path: Path, n: int) -> List[Tuple[int, int]]:
+    """Split a file into roughly equal byte ranges aligned to line starts.
+    
+    Each boundary is moved forward to the start of the next line, so every
+    line belongs to exactly one range and ranges can be parsed independently.
+    
+    Args:
+        file_path: Path to the file to split
+        n: Desired number of ranges
+        
+    Returns:
+        List of (start, end) byte offsets covering the whole file. May hold
+        fewer than n ranges for small files or very long lines.
+    """
+    size = file_path.stat().st_size
+    if size == 0:
+        return []
+    
+    bounds = [0]
+    with open(file_path, 'rb') as f:
+        for k in range(1, max(1, n)):
+            pos = size * k // n
+            if pos <= bounds[-1]:
+                continue
+            # Reading from pos - 1 consumes the rest of the line holding
+            # pos - 1, so tell() is the first line start at or after pos
+            f.seek(pos - 1)
+            f.readline()
+            pos = f.tell()
+            if pos >= size:
+                break
+            if pos > bounds[-1]:
+                bounds.append(pos)
+    bounds.append(size)
+    
+    return list(zip(bounds, bounds[1:]))
+
+
+def stream_range(file_path: Path, start: int, end: int, encoding: str = 'utf-8') -> Iterator[str]:
+    """Stream the lines within a byte range of a file.
+    
+    The range should come from iter_byte_chunks so that it starts at a line
+    boundary. The file is memory-mapped and each line is decoded on demand.
+    Lines are split like stream_file_lines in text mode: '\n', '\r\n' and
+    a lone '\r' all end a line.
+    
+    Args:
+        file_path: Path to the file to read
+        start: Byte offset of the first line in the range
+        end: Byte offset just past the last line in the range
+        encoding: Character encoding of the file (default: utf-8)
+        
+    Yields:
+        Individual lines from the range (without newline characters)
+    """
+    if start >= end:
+        return
+    
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        pos = start
+        while pos < end:
+            newline = mm.find(b'\n', pos, end)
+            if newline == -1:
+                newline = end
+            text = mm[pos:newline].decode(encoding)
+            if text.endswith('\r'):
+                text = text[:-1]
+            if '\r' in text:
+                # Old Mac-style line endings inside the '\n'-delimited span
+                yield from text.split('\r')
+            else:
+                yield text
+            pos = newline + 1
+
+
 class ParsingUtilities:
     """Common utilities for parsing log files."""
     
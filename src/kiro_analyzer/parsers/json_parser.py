@@ -2,15 +2,23 @@
 
 import json
 import logging
+import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Iterator
+from typing import Iterable, Iterator, Optional, Tuple
 
 from ..models import LogEntry
-from .base import stream_file_lines
+from .base import stream_file_lines, stream_range
 
 logger = logging.getLogger(__name__)
 
+# Data fields naming tools and languages. Their values come from a small
+# vocabulary and end up as ProductivityMetrics dict keys, so they are interned.
+_INTERNED_FIELDS = ('tool_name', 'tool', 'language')
+
+# Timestamp fields, in order of preference
+_TIMESTAMP_FIELDS = ('timestamp', 'time', 'datetime', 'date', '@timestamp', 'ts')
+
 
 class JSONLogParser:
     """Parser for JSON-formatted log files.
@@ -19,6 +27,21 @@ class JSONLogParser:
     It extracts timestamp, event_type, and data fields from each entry.
     """
     
+    # Last ISO timestamp string parsed and its result. Consecutive lines
+    # often carry the same timestamp, and a single-slot memo catches those
+    # repeats without the cost of a cache lookup on unique timestamps.
+    _last_timestamp: Tuple[Optional[str], Optional[datetime]] = (None, None)
+    
+    def __init__(self, store_raw_line: bool = True):
+        """Initialize the parser.
+        
+        Args:
+            store_raw_line: Keep each line's text in LogEntry.raw_line. When
+                           False, raw_line is left empty; the parsed data is
+                           unaffected and the line text can be freed
+        """
+        self.store_raw_line = store_raw_line
+    
     def can_parse(self, file_path: Path) -> bool:
         """Check if this parser can handle the given file.
         
@@ -58,9 +81,39 @@ class JSONLogParser:
         Yields:
             LogEntry objects parsed from the file
         """
+        yield from self._parse_lines(stream_file_lines(file_path), file_path)
+    
+    def parse_range(self, file_path: Path, start: int, end: int) -> Iterator[LogEntry]:
+        """Parse the lines within a byte range of a log file.
+        
+        Used to split one large file across worker processes. The range
+        should come from iter_byte_chunks so that it starts on a line.
+        
+        Args:
+            file_path: Path to the log file to parse
+            start: Byte offset of the first line in the range
+            end: Byte offset just past the last line in the range
+            
+        Yields:
+            LogEntry objects parsed from the range
+        """
+        yield from self._parse_lines(stream_range(file_path, start, end), file_path)
+    
+    def _parse_lines(self, lines: Iterable[str], file_path: Path) -> Iterator[LogEntry]:
+        """Parse log lines into entries.
+        
+        Args:
+            lines: Lines to parse (without newline characters)
+            file_path: Path of the file the lines came from. Line numbers in
+                      warnings are relative to the first line given
+            
+        Yields:
+            LogEntry objects parsed from the lines
+        """
         line_number = 0
+        store_raw_line = self.store_raw_line
         
-        for line in stream_file_lines(file_path):
+        for line in lines:
             line_number += 1
             
             # Skip empty lines
@@ -79,23 +132,26 @@ class JSONLogParser:
                 # Extract event type
                 event_type = self._extract_event_type(data)
                 
+                if isinstance(data, dict):
+                    self._intern_fields(data)
+                
                 # Create log entry
                 yield LogEntry(
                     timestamp=timestamp,
                     event_type=event_type,
                     data=data,
-                    raw_line=line,
+                    raw_line=line if store_raw_line else '',
                     source_file=file_path
                 )
                 
             except json.JSONDecodeError as e:
                 logger.warning(
-                    f"Malformed JSON at {file_path}:{line_number}: {e}. Skipping line."
+                    "Malformed JSON at %s:%d: %s. Skipping line.", file_path, line_number, e
                 )
                 continue
             except Exception as e:
                 logger.warning(
-                    f"Error parsing line {line_number} in {file_path}: {e}. Skipping line."
+                    "Error parsing line %d in %s: %s. Skipping line.", line_number, file_path, e
                 )
                 continue
     
@@ -110,15 +166,18 @@ class JSONLogParser:
             Parsed datetime object or None if timestamp cannot be extracted
         """
         # Try common timestamp field names
-        timestamp_fields = ['timestamp', 'time', 'datetime', 'date', '@timestamp', 'ts']
-        
-        for field in timestamp_fields:
+        for field in _TIMESTAMP_FIELDS:
             if field in data:
                 timestamp_value = data[field]
                 try:
                     # Try parsing ISO format
                     if isinstance(timestamp_value, str):
-                        return datetime.fromisoformat(timestamp_value.replace('Z', '+00:00'))
+                        last_value, last_timestamp = self._last_timestamp
+                        if timestamp_value == last_value:
+                            return last_timestamp
+                        timestamp = datetime.fromisoformat(timestamp_value.replace('Z', '+00:00'))
+                        self._last_timestamp = (timestamp_value, timestamp)
+                        return timestamp
                     # Try parsing Unix timestamp (seconds or milliseconds)
                     elif isinstance(timestamp_value, (int, float)):
                         # If value is very large, assume milliseconds
@@ -127,12 +186,24 @@ class JSONLogParser:
                         else:
                             return datetime.fromtimestamp(timestamp_value)
                 except (ValueError, OSError) as e:
-                    logger.warning(f"Invalid timestamp format at line {line_number}: {e}")
+                    logger.warning("Invalid timestamp format at line %d: %s", line_number, e)
                     continue
         
-        logger.warning(f"No valid timestamp found at line {line_number}")
+        logger.warning("No valid timestamp found at line %d", line_number)
         return None
     
+    @staticmethod
+    def _intern_fields(data: dict) -> None:
+        """Intern tool and language names in place.
+        
+        Args:
+            data: Parsed JSON data
+        """
+        for field in _INTERNED_FIELDS:
+            value = data.get(field)
+            if type(value) is str:
+                data[field] = sys.intern(value)
+    
     def _extract_event_type(self, data: dict) -> str:
         """Extract event type from JSON data.
         
@@ -147,6 +218,8 @@ class JSONLogParser:
         
         for field in event_fields:
             if field in data:
-                return str(data[field])
+                # Interned so calculators' comparisons against literals
+                # such as 'request' short-circuit on identity
+                return sys.intern(str(data[field]))
         
         return 'unknown'
@@ -3,6 +3,7 @@
 import json
 import logging
 import re
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Iterator, Optional, Dict, Any
@@ -12,6 +13,14 @@ from .base import stream_file_lines
 
 logger = logging.getLogger(__name__)
 
+# Pattern: YYYY-MM-DD HH:MM:SS.mmm [level] message. Kiro writes ASCII
+# timestamps and levels, so ASCII matching is safe and cheaper.
+_LINE_PATTERN = re.compile(
+    r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3})\s+\[(\w+)\]\s+(.+)$', re.ASCII
+)
+
+_AUTONOMY_MODE_PATTERN = re.compile(r'autonomyMode=(\w+)')
+
 
 class KiroLogParser:
     """Parser specifically designed for Kiro application logs.
@@ -20,6 +29,16 @@ class KiroLogParser:
     information such as tool invocations, conversations, response times, and code generation.
     """
     
+    def __init__(self, store_raw_line: bool = True):
+        """Initialize the parser.
+        
+        Args:
+            store_raw_line: Keep each line's text in LogEntry.raw_line. When
+                           False, raw_line is left empty; the parsed data is
+                           unaffected and the line text can be freed
+        """
+        self.store_raw_line = store_raw_line
+    
     def can_parse(self, file_path: Path) -> bool:
         """Check if this parser can handle the given file.
         
@@ -60,8 +79,10 @@ class KiroLogParser:
         for line in stream_file_lines(file_path):
             line_number += 1
             
-            # Skip empty lines
-            if not line.strip():
+            # Entries start with a timestamp. Checking the first character
+            # skips blank and continuation lines (e.g. stack traces) without
+            # copying the line for strip() or entering the line pattern
+            if not '0' <= line[:1] <= '9':
                 continue
             
             try:
@@ -70,7 +91,7 @@ class KiroLogParser:
                 if entry:
                     yield entry
             except Exception as e:
-                logger.debug(f"Could not parse line {line_number} in {file_path}: {e}")
+                logger.debug("Could not parse line %d in %s: %s", line_number, file_path, e)
                 continue
     
     def _parse_kiro_log_line(self, line: str, file_path: Path) -> Optional[LogEntry]:
@@ -83,18 +104,18 @@ class KiroLogParser:
         Returns:
             LogEntry if successfully parsed, None otherwise
         """
-        # Pattern: YYYY-MM-DD HH:MM:SS.mmm [level] message
-        timestamp_pattern = r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3})\s+\[(\w+)\]\s+(.+)$'
-        match = re.match(timestamp_pattern, line)
+        match = _LINE_PATTERN.match(line)
         
         if not match:
             return None
         
         timestamp_str, level, message = match.groups()
         
-        # Parse timestamp
+        # Parse timestamp. The pattern has already fixed its shape to
+        # YYYY-MM-DD HH:MM:SS.mmm, which fromisoformat reads directly and
+        # far faster than strptime's format interpretation
         try:
-            timestamp = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S.%f')
+            timestamp = datetime.fromisoformat(timestamp_str)
         except ValueError:
             return None
         
@@ -108,7 +129,7 @@ class KiroLogParser:
             timestamp=timestamp,
             event_type=event_type,
             data=data,
-            raw_line=line,
+            raw_line=line if self.store_raw_line else '',
             source_file=file_path
         )
     
@@ -122,13 +143,19 @@ class KiroLogParser:
         Returns:
             Dictionary of extracted data
         """
-        data = {'level': level, 'message': message}
-        
-        # Try to parse JSON content in message
-        json_match = re.search(r'\{.*\}', message)
-        if json_match:
+        # Levels and tool names repeat on every line; intern them so
+        # entries share one string object per distinct name
+        data = {'level': sys.intern(level), 'message': message}
+        
+        # Try to parse JSON content in message: the span from the first '{'
+        # to the last '}'. Messages are single lines, so this is the span a
+        # greedy \{.*\} would match, found with two C-level scans and no
+        # backtracking; messages without '{' cost a single find
+        start = message.find('{')
+        end = message.rfind('}') if start != -1 else -1
+        if end > start:
             try:
-                json_data = json.loads(json_match.group())
+                json_data = json.loads(message[start:end + 1])
                 data['json_payload'] = json_data
                 
                 # Extract specific Kiro metrics
@@ -146,7 +173,7 @@ class KiroLogParser:
                 data['event_subtype'] = 'agent_start'
                 # Extract autonomy mode
                 if 'autonomyMode=' in message:
-                    mode_match = re.search(r'autonomyMode=(\w+)', message)
+                    mode_match = _AUTONOMY_MODE_PATTERN.search(message)
                     if mode_match:
                         data['autonomy_mode'] = mode_match.group(1)
         
@@ -192,9 +219,12 @@ class KiroLogParser:
         if 'toolUses' in json_data:
             tool_uses = json_data['toolUses']
             if isinstance(tool_uses, list):
-                data['tools_used'] = [
-                    tool.get('name', 'unknown') for tool in tool_uses if isinstance(tool, dict)
-                ]
+                tools_used = []
+                for tool in tool_uses:
+                    if isinstance(tool, dict):
+                        name = tool.get('name', 'unknown')
+                        tools_used.append(sys.intern(name) if isinstance(name, str) else name)
+                data['tools_used'] = tools_used
                 data['tool_count'] = len(tool_uses)
         
         # Extract tool results
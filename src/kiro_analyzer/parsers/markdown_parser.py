@@ -2,6 +2,7 @@
 
 import logging
 import re
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Iterator, Optional, Dict, Any
@@ -11,6 +12,13 @@ from .base import stream_file_lines
 
 logger = logging.getLogger(__name__)
 
+_TITLE_PATTERN = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+_HEADING_PATTERN = re.compile(r'^#{1,6}\s+(.+)$', re.MULTILINE)
+_CODE_BLOCK_PATTERN = re.compile(r'```(\w*)\n(.*?)```', re.DOTALL)
+_LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^\)]+)\)')
+_BULLET_PATTERN = re.compile(r'^\s*[-*+]\s+(.+)$', re.MULTILINE)
+_WORKSPACE_ID_PATTERN = re.compile(r'/([a-f0-9]{8,})/[a-f0-9]{8,}/')
+
 
 class MarkdownParser:
     """Parser for markdown files in Kiro workspace storage.
@@ -85,18 +93,18 @@ class MarkdownParser:
         }
         
         # Extract title (first H1 heading)
-        title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+        title_match = _TITLE_PATTERN.search(content)
         if title_match:
             data['project_title'] = title_match.group(1).strip()
         
         # Extract all headings
-        headings = re.findall(r'^#{1,6}\s+(.+)$', content, re.MULTILINE)
+        headings = _HEADING_PATTERN.findall(content)
         data['heading_count'] = len(headings)
         if headings:
             data['headings'] = headings[:10]  # First 10 headings
         
         # Extract code blocks
-        code_blocks = re.findall(r'```(\w*)\n(.*?)```', content, re.DOTALL)
+        code_blocks = _CODE_BLOCK_PATTERN.findall(content)
         if code_blocks:
             data['code_block_count'] = len(code_blocks)
             # Count lines of code in blocks
@@ -104,25 +112,25 @@ class MarkdownParser:
             data['code_lines'] = total_code_lines
             
             # Extract languages used
-            languages = [lang for lang, _ in code_blocks if lang]
+            languages = {sys.intern(lang) for lang, _ in code_blocks if lang}
             if languages:
-                data['languages'] = list(set(languages))
+                data['languages'] = list(languages)
         
-        # Extract links
-        links = re.findall(r'\[([^\]]+)\]\(([^\)]+)\)', content)
-        if links:
-            data['link_count'] = len(links)
+        # Count links and bullet points; only the counts are kept, so
+        # iterate over matches instead of building lists of groups
+        link_count = sum(1 for _ in _LINK_PATTERN.finditer(content))
+        if link_count:
+            data['link_count'] = link_count
         
-        # Extract features/bullet points
-        bullets = re.findall(r'^\s*[-*+]\s+(.+)$', content, re.MULTILINE)
-        if bullets:
-            data['bullet_count'] = len(bullets)
+        bullet_count = sum(1 for _ in _BULLET_PATTERN.finditer(content))
+        if bullet_count:
+            data['bullet_count'] = bullet_count
         
         # Try to identify project type from content
         data['project_type'] = self._identify_project_type(content)
         
         # Extract workspace ID from path
-        workspace_match = re.search(r'/([a-f0-9]{8,})/[a-f0-9]{8,}/', str(file_path))
+        workspace_match = _WORKSPACE_ID_PATTERN.search(str(file_path))
         if workspace_match:
             data['workspace_id'] = workspace_match.group(1)
         
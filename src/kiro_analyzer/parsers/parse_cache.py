@@ -0,0 +1,188 @@
+"""On-disk cache of parsed log entries."""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+
+from .. import __version__
+from ..models import LogEntry
+
+logger = logging.getLogger(__name__)
+
+
+class ParseCache:
+    """Cache of parsed LogEntry lists, one pickle file per log file.
+    
+    Entries are keyed on the log file's path, modification time and size
+    (plus the package version), so a cached result is used only while the
+    file is unchanged and becomes unreachable as soon as it is modified.
+    
+    Each key starts with a digest of the path (and the caller's namespace)
+    alone, so storing a new entry for a log replaces the entry for its
+    previous state. The directory is
+    also capped in size: the least recently used entries are evicted first.
+    """
+    
+    # Total size of cached entries kept in the directory
+    DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+    
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize the cache.
+        
+        Args:
+            cache_dir: Directory holding cached parse results. Created on
+                      first write if it does not exist
+            max_bytes: Size cap for the directory's cached entries
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+    
+    def key_for(self, file_path: Path, namespace: str = '') -> Optional[str]:
+        """Compute the cache key for a log file's current state.
+        
+        Args:
+            file_path: Path to the log file
+            namespace: Identifies how the file is parsed (e.g. the parsers
+                      and their options), so entries parsed differently
+                      never match and coexist under one size cap
+            
+        Returns:
+            Key of the form '<path digest>-<state digest>' identifying the
+            file's current contents, or None if the file cannot be stat-ed
+        """
+        try:
+            stat_info = file_path.stat()
+        except OSError:
+            return None
+        
+        path_id = f"{namespace}:{file_path.resolve()}"
+        state = f"{__version__}:{stat_info.st_mtime_ns}:{stat_info.st_size}"
+        path_digest = hashlib.blake2b(path_id.encode('utf-8'), digest_size=8).hexdigest()
+        state_digest = hashlib.blake2b(state.encode('utf-8'), digest_size=8).hexdigest()
+        return f"{path_digest}-{state_digest}"
+    
+    def contains(self, key: str) -> bool:
+        """Check whether an entry is cached.
+        
+        Args:
+            key: Cache key from key_for
+            
+        Returns:
+            True if an entry exists for the key
+        """
+        return (self.cache_dir / f"{key}.pickle").exists()
+    
+    def load(self, key: str) -> Optional[List[LogEntry]]:
+        """Load cached entries.
+        
+        A hit refreshes the entry's modification time, which the size cap
+        uses as its last-used time.
+        
+        Args:
+            key: Cache key from key_for
+            
+        Returns:
+            Cached list of entries, or None on a miss or unreadable entry
+        """
+        entry_path = self.cache_dir / f"{key}.pickle"
+        try:
+            with open(entry_path, 'rb') as f:
+                entries = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Ignoring unreadable parse cache entry %s: %s", key, e)
+            return None
+        
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        return entries
+    
+    def store(self, key: str, entries: List[LogEntry]) -> None:
+        """Store parsed entries.
+        
+        The entry is written to a temporary file and renamed into place, so
+        concurrent readers never see a partial write. Entries for earlier
+        states of the same file are then removed, and the directory is
+        pruned to its size cap. Failures are logged and otherwise ignored;
+        the cache is only an optimization.
+        
+        Args:
+            key: Cache key from key_for
+            entries: Parsed entries to cache
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_name, self.cache_dir / f"{key}.pickle")
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except Exception as e:
+            logger.warning("Could not write parse cache entry %s: %s", key, e)
+            return
+        
+        self._remove_superseded(key)
+        self._prune(key)
+    
+    def _remove_superseded(self, key: str) -> None:
+        """Delete the entries stored for earlier states of a key's file.
+        
+        Args:
+            key: Cache key that was just stored
+        """
+        path_digest = key.partition('-')[0]
+        for entry_path in self.cache_dir.glob(f"{path_digest}-*.pickle"):
+            if entry_path.stem != key:
+                self._unlink(entry_path)
+    
+    def _prune(self, keep_key: str) -> None:
+        """Evict least recently used entries until the cap is met.
+        
+        Args:
+            keep_key: Cache key that is never evicted (the one just stored)
+        """
+        cached = []
+        total = 0
+        for entry_path in self.cache_dir.glob("*.pickle"):
+            try:
+                stat_info = entry_path.stat()
+            except OSError:
+                continue
+            cached.append((stat_info.st_mtime_ns, stat_info.st_size, entry_path))
+            total += stat_info.st_size
+        
+        if total <= self.max_bytes:
+            return
+        
+        # Oldest first; mtime is refreshed on every hit
+        cached.sort()
+        for _, size, entry_path in cached:
+            if total <= self.max_bytes:
+                break
+            if entry_path.stem != keep_key:
+                self._unlink(entry_path)
+                total -= size
+    
+    @staticmethod
+    def _unlink(entry_path: Path) -> None:
+        """Delete a cache entry, ignoring entries already removed.
+        
+        Args:
+            entry_path: Path of the pickle file to delete
+        """
+        try:
+            entry_path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("Could not remove parse cache entry %s: %s", entry_path.name, e)
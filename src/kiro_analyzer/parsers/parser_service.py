@@ -1,16 +1,138 @@
 """Parser service for orchestrating log file parsing."""
 
 import logging
+import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ..models import LogEntry
+from ..protocols import LogParser
+from .base import iter_byte_chunks
+from .parse_cache import ParseCache
 from .registry import ParserRegistry
 from .json_parser import JSONLogParser
 from .text_parser import PlainTextLogParser
 
 logger = logging.getLogger(__name__)
 
+# Parser service owned by a worker process, set by _init_worker
+_worker_service: Optional['ParserService'] = None
+
+# Date range the worker process keeps entries for, set by _init_worker
+_worker_date_range: Optional[Tuple[datetime, datetime]] = None
+
+# Unit of parallel work: (path, start, end). An end of None means the whole
+# file; otherwise only the lines within the byte range are parsed.
+ParseTask = Tuple[Path, int, Optional[int]]
+
+
+def _date_filter(date_range: Optional[Tuple[datetime, datetime]]) -> Optional[Callable[[LogEntry], bool]]:
+    """Build a predicate selecting entries within a date range.
+    
+    Matches AnalyzerService.filter_by_date_range: both ends are inclusive
+    and timestamps are compared as naive datetimes.
+    
+    Args:
+        date_range: Optional (start, end) tuple
+        
+    Returns:
+        Predicate over log entries, or None if no range was given
+    """
+    if date_range is None:
+        return None
+    
+    start, end = (d.replace(tzinfo=None) if d.tzinfo is not None else d for d in date_range)
+    
+    def in_range(entry: LogEntry) -> bool:
+        timestamp = entry.timestamp
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.replace(tzinfo=None)
+        return start <= timestamp <= end
+    
+    return in_range
+
+
+def _describe_value(value: Any) -> str:
+    """Describe a parser option for the parse cache namespace.
+    
+    Args:
+        value: Option value
+        
+    Returns:
+        Stable text for compiled patterns and containers, repr otherwise
+    """
+    if isinstance(value, re.Pattern):
+        return f"re({value.pattern!r}, {value.flags})"
+    if isinstance(value, (list, tuple)):
+        return '[' + ','.join(_describe_value(item) for item in value) + ']'
+    return repr(value)
+
+
+def _describe_parser(parser: LogParser) -> str:
+    """Describe a parser's class and public options.
+    
+    Private attributes are left out; they hold per-parse state such as
+    memoized timestamps. Options whose repr is not stable across processes
+    only cost cache misses, never wrong hits.
+    
+    Args:
+        parser: Registered parser
+        
+    Returns:
+        Text identifying how the parser parses files
+    """
+    cls = type(parser)
+    options = ','.join(
+        f"{name}={_describe_value(value)}"
+        for name, value in sorted(getattr(parser, '__dict__', {}).items())
+        if not name.startswith('_')
+    )
+    return f"{cls.__module__}.{cls.__qualname__}({options})"
+
+
+def _init_worker(
+    registry: ParserRegistry,
+    cache: Optional[ParseCache],
+    date_range: Optional[Tuple[datetime, datetime]]
+) -> None:
+    """Create the parser service used by a worker process.
+    
+    Args:
+        registry: ParserRegistry shipped from the parent process
+        cache: Parse cache of the parent service, if any
+        date_range: Date range to keep entries for, if any
+    """
+    global _worker_service, _worker_date_range
+    _worker_service = ParserService(registry)
+    _worker_service.cache = cache
+    _worker_date_range = date_range
+
+
+def _parse_one(task: ParseTask) -> Optional[List[LogEntry]]:
+    """Parse a single file or file range inside a worker process.
+    
+    Module-level so it can be pickled for ProcessPoolExecutor.
+    
+    Args:
+        task: (path, start, end) tuple describing the work
+        
+    Returns:
+        List of parsed entries (empty if the file was skipped), or None if
+        a byte range failed to parse. Byte ranges are returned unfiltered
+        when caching is enabled, so the parent can cache the whole file.
+    """
+    file_path, start, end = task
+    if end is None:
+        return _worker_service._parse_file_or_skip(file_path, _worker_date_range)
+    
+    entries = _worker_service._parse_range_or_skip(file_path, start, end)
+    in_range = _date_filter(_worker_date_range)
+    if entries is not None and in_range is not None and _worker_service.cache is None:
+        entries = [entry for entry in entries if in_range(entry)]
+    return entries
+
 
 class ParserService:
     """Service for parsing log files using registered parsers.
@@ -19,12 +141,33 @@ class ParserService:
     appropriate parser for each file and handling errors gracefully.
     """
     
-    def __init__(self, registry: ParserRegistry = None):
+    # Files at least this large are split into byte ranges when parsing in
+    # parallel, if their parser supports parse_range
+    SHARD_MIN_BYTES = 32 * 1024 * 1024
+    
+    def __init__(
+        self,
+        registry: ParserRegistry = None,
+        n_workers: int = 1,
+        chunksize: int = 1,
+        cache_dir: Optional[Path] = None,
+        store_raw_lines: bool = True
+    ):
         """Initialize the parser service.
         
         Args:
             registry: ParserRegistry instance. If None, creates a new registry
                      with default parsers (KiroLogParser, JSONLogParser, MarkdownParser, PlainTextLogParser)
+            n_workers: Number of worker processes used by parse_files.
+                      1 (the default) parses files serially in this process
+            chunksize: Number of files handed to a worker at a time
+            cache_dir: Directory for caching parsed entries per file, keyed
+                      on path, modification time and size. None disables
+                      caching. Only the latest entry per file is kept, and
+                      the directory is capped at ParseCache.DEFAULT_MAX_BYTES
+            store_raw_lines: Whether the default parsers keep each line's
+                            text in LogEntry.raw_line. Ignored when a
+                            registry is given
         """
         if registry is None:
             registry = ParserRegistry()
@@ -33,14 +176,22 @@ class ParserService:
             from .kiro_parser import KiroLogParser
             from .markdown_parser import MarkdownParser
             
-            registry.register_parser(KiroLogParser())
+            registry.register_parser(KiroLogParser(store_raw_lines))
             registry.register_parser(MarkdownParser())
-            registry.register_parser(JSONLogParser())
-            registry.register_parser(PlainTextLogParser())
+            registry.register_parser(JSONLogParser(store_raw_lines))
+            registry.register_parser(PlainTextLogParser(store_raw_lines))
         
         self.registry = registry
+        self.n_workers = max(1, n_workers)
+        self.chunksize = max(1, chunksize)
+        self.cache_dir = cache_dir
+        self.cache = ParseCache(cache_dir) if cache_dir is not None else None
     
-    def parse_file(self, file_path: Path) -> List[LogEntry]:
+    def parse_file(
+        self,
+        file_path: Path,
+        date_range: Optional[Tuple[datetime, datetime]] = None
+    ) -> List[LogEntry]:
         """Parse a log file and return successfully parsed entries.
         
         This method selects the appropriate parser for the file, parses it,
@@ -49,6 +200,8 @@ class ParserService:
         
         Args:
             file_path: Path to the log file to parse
+            date_range: Optional (start, end) tuple. Entries outside it are
+                       dropped as they are parsed instead of being collected
             
         Returns:
             List of successfully parsed LogEntry objects
@@ -66,27 +219,33 @@ class ParserService:
         if parser is None:
             raise ValueError(f"No parser available for file: {file_path}")
         
-        logger.info(f"Parsing {file_path} with {parser.__class__.__name__}")
+        logger.info("Parsing %s with %s", file_path, parser.__class__.__name__)
         
         # Parse file and collect entries
         entries = []
         error_count = 0
+        in_range = _date_filter(date_range)
         
         try:
             for entry in parser.parse(file_path):
-                entries.append(entry)
+                if in_range is None or in_range(entry):
+                    entries.append(entry)
         except Exception as e:
-            logger.error(f"Error parsing {file_path}: {e}")
+            logger.error("Error parsing %s: %s", file_path, e)
             error_count += 1
         
-        logger.info(
-            f"Parsed {len(entries)} entries from {file_path}"
-            + (f" ({error_count} errors)" if error_count > 0 else "")
-        )
+        if error_count > 0:
+            logger.info("Parsed %d entries from %s (%d errors)", len(entries), file_path, error_count)
+        else:
+            logger.info("Parsed %d entries from %s", len(entries), file_path)
         
         return entries
     
-    def parse_files(self, file_paths: List[Path]) -> List[LogEntry]:
+    def parse_files(
+        self,
+        file_paths: List[Path],
+        date_range: Optional[Tuple[datetime, datetime]] = None
+    ) -> List[LogEntry]:
         """Parse multiple log files and return all successfully parsed entries.
         
         This method parses multiple files and aggregates all entries.
@@ -94,23 +253,189 @@ class ParserService:
         
         Args:
             file_paths: List of paths to log files to parse
+            date_range: Optional (start, end) tuple, both inclusive. Only
+                       entries within it are returned, and out-of-range
+                       entries are discarded while parsing rather than
+                       collected and filtered afterwards
             
         Returns:
             List of all successfully parsed LogEntry objects from all files
         """
         all_entries = []
         
+        tasks, shard_keys = self._plan_tasks(file_paths) if self.n_workers > 1 else ([], {})
+        
+        if len(tasks) > 1:
+            in_range = _date_filter(date_range)
+            
+            # With caching, byte ranges come back unfiltered and are gathered
+            # per file; a file is cached once all of its ranges parsed
+            sharded: Dict[Path, List[LogEntry]] = {}
+            failed_shards = set()
+            
+            # Parsing is CPU-bound, so use processes to sidestep the GIL.
+            # Each worker builds its own service from the pickled registry.
+            with ProcessPoolExecutor(
+                max_workers=min(self.n_workers, len(tasks)),
+                initializer=_init_worker,
+                initargs=(self.registry, self.cache, date_range)
+            ) as executor:
+                results = executor.map(_parse_one, tasks, chunksize=self.chunksize)
+                for (file_path, _, end), entries in zip(tasks, results):
+                    if entries is None:
+                        failed_shards.add(file_path)
+                        continue
+                    if end is not None and self.cache is not None:
+                        sharded.setdefault(file_path, []).extend(entries)
+                        if in_range is not None:
+                            entries = [entry for entry in entries if in_range(entry)]
+                    all_entries.extend(entries)
+            
+            for file_path, entries in sharded.items():
+                if file_path not in failed_shards and file_path in shard_keys:
+                    self._store_cached(file_path, shard_keys[file_path], entries)
+        else:
+            for file_path in file_paths:
+                all_entries.extend(self._parse_file_or_skip(file_path, date_range))
+        
+        logger.info("Parsed %d total entries from %d files", len(all_entries), len(file_paths))
+        
+        return all_entries
+    
+    def _parse_file_or_skip(
+        self,
+        file_path: Path,
+        date_range: Optional[Tuple[datetime, datetime]] = None
+    ) -> List[LogEntry]:
+        """Parse a file, logging and skipping it on failure.
+        
+        Args:
+            file_path: Path to the log file to parse
+            date_range: Optional (start, end) tuple to keep entries for
+            
+        Returns:
+            List of parsed entries, or an empty list if the file was skipped
+        """
+        key = self._cache_key(file_path)
+        
+        try:
+            if key is None:
+                return self.parse_file(file_path, date_range)
+            
+            # The cache holds every entry of a file, so filter afterwards
+            entries = self.cache.load(key)
+            if entries is not None:
+                logger.info("Loaded %d cached entries for %s", len(entries), file_path)
+            else:
+                entries = self.parse_file(file_path)
+                self.cache.store(key, entries)
+            
+            in_range = _date_filter(date_range)
+            if in_range is None:
+                return entries
+            return [entry for entry in entries if in_range(entry)]
+        except (FileNotFoundError, ValueError) as e:
+            logger.warning("Skipping %s: %s", file_path, e)
+        except Exception as e:
+            logger.error("Unexpected error parsing %s: %s", file_path, e)
+        return []
+    
+    def _plan_tasks(self, file_paths: List[Path]) -> Tuple[List[ParseTask], Dict[Path, str]]:
+        """Build the list of parallel parse tasks.
+        
+        Large files whose parser supports parse_range are split into one
+        line-aligned byte range per worker, so a single big file does not
+        keep the other workers idle. Tasks stay in file order, and ranges of
+        a file stay in offset order.
+        
+        Args:
+            file_paths: List of paths to log files to parse
+            
+        Returns:
+            Tuple of the (path, start, end) tasks and, when caching is
+            enabled, the cache key of each split file taken before its
+            ranges were planned
+        """
+        tasks: List[ParseTask] = []
+        shard_keys: Dict[Path, str] = {}
+        
         for file_path in file_paths:
             try:
-                entries = self.parse_file(file_path)
-                all_entries.extend(entries)
-            except (FileNotFoundError, ValueError) as e:
-                logger.warning(f"Skipping {file_path}: {e}")
-                continue
-            except Exception as e:
-                logger.error(f"Unexpected error parsing {file_path}: {e}")
-                continue
+                size = file_path.stat().st_size
+            except OSError:
+                # Let the worker report the missing/unreadable file
+                size = 0
+            
+            if size >= self.SHARD_MIN_BYTES:
+                key = self._cache_key(file_path)
+                parser = None
+                if key is None or not self.cache.contains(key):
+                    parser = self.registry.get_parser(file_path)
+                if hasattr(parser, 'parse_range'):
+                    tasks.extend(
+                        (file_path, start, end)
+                        for start, end in iter_byte_chunks(file_path, self.n_workers)
+                    )
+                    if key is not None:
+                        shard_keys[file_path] = key
+                    continue
+            
+            tasks.append((file_path, 0, None))
         
-        logger.info(f"Parsed {len(all_entries)} total entries from {len(file_paths)} files")
+        return tasks, shard_keys
+    
+    def _parse_range_or_skip(self, file_path: Path, start: int, end: int) -> Optional[List[LogEntry]]:
+        """Parse a byte range of a file, logging and skipping it on failure.
         
-        return all_entries
+        Args:
+            file_path: Path to the log file to parse
+            start: Byte offset of the first line in the range
+            end: Byte offset just past the last line in the range
+            
+        Returns:
+            List of parsed entries, or None if the range was skipped
+        """
+        try:
+            parser = self.registry.get_parser(file_path)
+            return list(parser.parse_range(file_path, start, end))
+        except (FileNotFoundError, ValueError) as e:
+            logger.warning("Skipping %s bytes %d-%d: %s", file_path, start, end, e)
+        except Exception as e:
+            logger.error("Unexpected error parsing %s bytes %d-%d: %s", file_path, start, end, e)
+        return None
+    
+    def _store_cached(self, file_path: Path, key: str, entries: List[LogEntry]) -> None:
+        """Cache all entries of a file that was parsed as byte ranges.
+        
+        The entries are stored only if the file is unchanged since its
+        ranges were planned. A log appended to while it was being parsed
+        would otherwise be cached, incomplete, under its new state.
+        
+        Args:
+            file_path: Path to the log file
+            key: Cache key of the file taken when its ranges were planned
+            entries: Every entry parsed from the file, in file order
+        """
+        if self._cache_key(file_path) == key:
+            self.cache.store(key, entries)
+        else:
+            logger.info("Not caching %s: it changed while being parsed", file_path)
+    
+    def _cache_key(self, file_path: Path) -> Optional[str]:
+        """Compute a file's parse cache key for the current parsers.
+        
+        The key's namespace describes the registered parsers, so entries
+        produced by one registry (or one set of parser options, such as
+        store_raw_line or added patterns) are never served to another.
+        
+        Args:
+            file_path: Path to the log file
+            
+        Returns:
+            Cache key, or None if caching is disabled or the file cannot be
+            stat-ed
+        """
+        if self.cache is None:
+            return None
+        namespace = ';'.join(_describe_parser(p) for p in self.registry.get_all_parsers())
+        return self.cache.key_for(file_path, namespace)
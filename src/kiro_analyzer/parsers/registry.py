@@ -1,7 +1,7 @@
 """Parser registry for managing log parsers."""
 
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from ..protocols import LogParser
 
@@ -11,11 +11,16 @@ class ParserRegistry:
     
     The registry maintains a collection of parsers and selects the appropriate
     parser for a given file based on the parser's can_parse() method.
+    
+    Some parsers sniff file contents in can_parse(), so the selection is
+    cached per file and reused until the file's modification time or size
+    changes.
     """
     
     def __init__(self):
         """Initialize an empty parser registry."""
         self._parsers: List[LogParser] = []
+        self._selected: Dict[Tuple[Path, int, int], Optional[LogParser]] = {}
     
     def register_parser(self, parser: LogParser) -> None:
         """Register a new parser with the registry.
@@ -24,6 +29,7 @@ class ParserRegistry:
             parser: LogParser instance to register
         """
         self._parsers.append(parser)
+        self._selected.clear()
     
     def get_parser(self, file_path: Path) -> Optional[LogParser]:
         """Get the first parser that can handle the given file.
@@ -34,6 +40,25 @@ class ParserRegistry:
         Returns:
             LogParser instance that can parse the file, or None if no parser found
         """
+        try:
+            stat_info = file_path.stat()
+        except OSError:
+            return self._select_parser(file_path)
+        
+        key = (file_path, stat_info.st_mtime_ns, stat_info.st_size)
+        if key not in self._selected:
+            self._selected[key] = self._select_parser(file_path)
+        return self._selected[key]
+    
+    def _select_parser(self, file_path: Path) -> Optional[LogParser]:
+        """Ask each parser in registration order whether it handles a file.
+        
+        Args:
+            file_path: Path to the log file
+            
+        Returns:
+            First LogParser whose can_parse() accepts the file, or None
+        """
         for parser in self._parsers:
             if parser.can_parse(file_path):
                 return parser
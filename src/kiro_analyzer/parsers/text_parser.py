@@ -2,15 +2,29 @@
 
 import logging
 import re
+import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Iterator, Optional, Pattern
+from typing import Iterable, Iterator, Optional, Pattern
 
 from ..models import LogEntry
-from .base import stream_file_lines
+from .base import stream_file_lines, stream_range
 
 logger = logging.getLogger(__name__)
 
+# strptime fallbacks for timestamps fromisoformat rejects, keyed by
+# (date/time separator, has fractional seconds). Each format's literals
+# rule out the others, so at most one of them can match a given string.
+_DASHED_FORMATS = {
+    (' ', False): '%Y-%m-%d %H:%M:%S',
+    (' ', True): '%Y-%m-%d %H:%M:%S.%f',
+    ('T', False): '%Y-%m-%dT%H:%M:%S',
+    ('T', True): '%Y-%m-%dT%H:%M:%S.%f',
+}
+
+# Slash-separated formats: Apache-style and year-first
+_SLASHED_FORMATS = ('%d/%b/%Y:%H:%M:%S', '%Y/%m/%d %H:%M:%S')
+
 
 class PlainTextLogParser:
     """Parser for plain text structured log files.
@@ -36,13 +50,26 @@ class PlainTextLogParser:
         r'^(?P<timestamp>\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:\d{2})?)\s+-\s+(?P<event_type>\w+)\s+-\s+(?P<message>.*)'
     )
     
-    def __init__(self):
-        """Initialize the plain text parser with default patterns."""
-        self.patterns = [
-            self.PATTERN_BRACKETED,
-            self.PATTERN_COLON,
-            self.PATTERN_DASH
-        ]
+    _DEFAULT_PATTERNS = (PATTERN_BRACKETED, PATTERN_COLON, PATTERN_DASH)
+    
+    # The default patterns as one alternation, tried in the same order, so a
+    # line is classified by a single match() call. The named groups are
+    # dropped; alternative k captures groups 3k+1..3k+3.
+    _COMBINED = re.compile('|'.join(
+        '(?:%s)' % re.sub(r'\(\?P<\w+>', '(', pattern.pattern)
+        for pattern in _DEFAULT_PATTERNS
+    ))
+    
+    def __init__(self, store_raw_line: bool = True):
+        """Initialize the plain text parser with default patterns.
+        
+        Args:
+            store_raw_line: Keep each line's text in LogEntry.raw_line. When
+                           False, raw_line is left empty; the parsed data is
+                           unaffected and the line text can be freed
+        """
+        self.store_raw_line = store_raw_line
+        self.patterns = list(self._DEFAULT_PATTERNS)
     
     def can_parse(self, file_path: Path) -> bool:
         """Check if this parser can handle the given file.
@@ -67,59 +94,113 @@ class PlainTextLogParser:
         Yields:
             LogEntry objects parsed from the file
         """
+        yield from self._parse_lines(stream_file_lines(file_path), file_path)
+    
+    def parse_range(self, file_path: Path, start: int, end: int) -> Iterator[LogEntry]:
+        """Parse the lines within a byte range of a log file.
+        
+        Used to split one large file across worker processes. The range
+        should come from iter_byte_chunks so that it starts on a line.
+        
+        Args:
+            file_path: Path to the log file to parse
+            start: Byte offset of the first line in the range
+            end: Byte offset just past the last line in the range
+            
+        Yields:
+            LogEntry objects parsed from the range
+        """
+        yield from self._parse_lines(stream_range(file_path, start, end), file_path)
+    
+    def _parse_lines(self, lines: Iterable[str], file_path: Path) -> Iterator[LogEntry]:
+        """Parse log lines into entries.
+        
+        Args:
+            lines: Lines to parse (without newline characters)
+            file_path: Path of the file the lines came from. Line numbers in
+                      warnings are relative to the first line given
+            
+        Yields:
+            LogEntry objects parsed from the lines
+        """
         line_number = 0
+        store_raw_line = self.store_raw_line
         
-        for line in stream_file_lines(file_path):
+        # The built-in patterns are matched in one pass through _COMBINED
+        # while they are still the first patterns in the list; any others
+        # (e.g. from add_pattern) are tried in order after it misses. The
+        # patterns are snapshotted as a tuple for the duration of the parse.
+        patterns = tuple(self.patterns)
+        if patterns[:3] == self._DEFAULT_PATTERNS:
+            combined = self._COMBINED
+            fallback_patterns = patterns[3:]
+        else:
+            combined = None
+            fallback_patterns = patterns
+        
+        for line in lines:
             line_number += 1
             
             # Skip empty lines
             if not line.strip():
                 continue
             
-            # Try each pattern
-            for pattern in self.patterns:
-                match = pattern.match(line)
-                if match:
-                    try:
+            match = combined.match(line) if combined is not None else None
+            groups = None
+            if match is None:
+                for pattern in fallback_patterns:
+                    match = pattern.match(line)
+                    if match:
                         groups = match.groupdict()
-                        
-                        # Extract timestamp
-                        timestamp = self._parse_timestamp(groups.get('timestamp', ''))
-                        if timestamp is None:
-                            logger.warning(
-                                f"Could not parse timestamp at {file_path}:{line_number}"
-                            )
-                            break
-                        
-                        # Extract event type
-                        event_type = groups.get('event_type', 'unknown').strip()
-                        
-                        # Extract message and any additional data
-                        message = groups.get('message', '').strip()
-                        data = {
-                            'message': message,
-                            'event_type': event_type
-                        }
-                        
-                        # Create log entry
-                        yield LogEntry(
-                            timestamp=timestamp,
-                            event_type=event_type,
-                            data=data,
-                            raw_line=line,
-                            source_file=file_path
-                        )
-                        break
-                        
-                    except Exception as e:
-                        logger.warning(
-                            f"Error parsing line {line_number} in {file_path}: {e}"
-                        )
                         break
-            else:
-                # No pattern matched
-                logger.debug(
-                    f"No pattern matched for line {line_number} in {file_path}"
+                else:
+                    # No pattern matched
+                    logger.debug(
+                        "No pattern matched for line %d in %s", line_number, file_path
+                    )
+                    continue
+            
+            try:
+                if groups is None:
+                    # Each alternative of _COMBINED ends with its
+                    # (timestamp, event type, message) groups
+                    last = match.lastindex
+                    timestamp_str, event_type, message = match.group(last - 2, last - 1, last)
+                else:
+                    timestamp_str = groups.get('timestamp', '')
+                    event_type = groups.get('event_type', 'unknown')
+                    message = groups.get('message', '')
+                
+                # Extract timestamp
+                timestamp = self._parse_timestamp(timestamp_str)
+                if timestamp is None:
+                    logger.warning(
+                        "Could not parse timestamp at %s:%d", file_path, line_number
+                    )
+                    continue
+                
+                # Extract event type (interned, see JSONLogParser)
+                event_type = sys.intern(event_type.strip())
+                
+                # Extract message and any additional data
+                message = message.strip()
+                data = {
+                    'message': message,
+                    'event_type': event_type
+                }
+                
+                # Create log entry
+                yield LogEntry(
+                    timestamp=timestamp,
+                    event_type=event_type,
+                    data=data,
+                    raw_line=line if store_raw_line else '',
+                    source_file=file_path
+                )
+                
+            except Exception as e:
+                logger.warning(
+                    "Error parsing line %d in %s: %s", line_number, file_path, e
                 )
     
     def _parse_timestamp(self, timestamp_str: str) -> Optional[datetime]:
@@ -134,21 +215,20 @@ class PlainTextLogParser:
         if not timestamp_str:
             return None
         
-        # Try ISO format first
-        try:
-            return datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-        except ValueError:
-            pass
-        
-        # Try common formats
-        formats = [
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%d %H:%M:%S.%f',
-            '%Y-%m-%dT%H:%M:%S',
-            '%Y-%m-%dT%H:%M:%S.%f',
-            '%d/%b/%Y:%H:%M:%S',
-            '%Y/%m/%d %H:%M:%S',
-        ]
+        # Slash-separated timestamps are never ISO 8601, so they go straight
+        # to strptime without a failing fromisoformat call
+        if '/' in timestamp_str:
+            formats = _SLASHED_FORMATS
+        else:
+            try:
+                return datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+            except ValueError:
+                pass
+            
+            # Pick the only common format that could match instead of
+            # trying each in turn, so a line costs at most one failed strptime
+            separator = 'T' if 'T' in timestamp_str else ' '
+            formats = (_DASHED_FORMATS[separator, '.' in timestamp_str],)
         
         for fmt in formats:
             try:
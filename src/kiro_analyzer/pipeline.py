@@ -0,0 +1,144 @@
+"""Shared analysis pipeline: discovery → parsing → analysis → reporting."""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from .analyzers import (
+    ActivityPatternCalculator,
+    CharacterCountCalculator,
+    CodeGenerationCalculator,
+    RequestCountCalculator,
+    ResponseTimeCalculator,
+    ToolUsageCalculator,
+)
+from .models import AnalyzerConfig
+from .parsers.parser_service import ParserService
+from .protocols import MetricCalculator
+from .reporters.reporter_service import ReporterService, ReportFormat
+from .services.analyzer_service import AnalyzerService
+from .services.config_manager import ConfigManager
+from .services.log_discovery import LogDiscoveryService
+
+
+class EmptyAnalysisError(Exception):
+    """Raised when there are no log files or no parseable entries to analyze."""
+
+
+def _no_progress(message: str) -> None:
+    """Discard a progress message."""
+
+
+def default_calculators() -> List[MetricCalculator]:
+    """Create the calculators used for a standard report.
+    
+    Returns:
+        List of metric calculator instances
+    """
+    return [
+        RequestCountCalculator(),
+        ResponseTimeCalculator(),
+        CodeGenerationCalculator(),
+        CharacterCountCalculator(),
+        ToolUsageCalculator(),
+        ActivityPatternCalculator(),
+    ]
+
+
+def run_pipeline(
+    config: AnalyzerConfig,
+    start_date: datetime,
+    end_date: datetime,
+    output_format: str,
+    output_path: Optional[Path] = None,
+    report_name: str = "kiro_analysis",
+    use_cache: bool = True,
+    progress: Optional[Callable[[str], None]] = None
+) -> Tuple[str, Optional[Path]]:
+    """Discover, parse and analyze logs for a date range, then build a report.
+    
+    Args:
+        config: Analyzer configuration
+        start_date: Start of the analysis period
+        end_date: End of the analysis period
+        output_format: Report format ('json', 'csv' or 'console')
+        output_path: Where to save the report. If None and the format is not
+                    'console', a timestamped file in the configured output
+                    directory is used
+        report_name: Base name for timestamped report files
+        use_cache: Whether to reuse cached parse results
+        progress: Optional callback receiving progress messages
+        
+    Returns:
+        Tuple of (report content, path the report was saved to or None)
+        
+    Raises:
+        EmptyAnalysisError: If no log files or no log entries are found
+        FileNotFoundError: If the Kiro application folder does not exist
+        PermissionError: If the Kiro application folder is not readable
+    """
+    progress = progress or _no_progress
+    
+    # Step 1: Discover log files
+    discovery_service = LogDiscoveryService(config.kiro_app_folder)
+    log_files = discovery_service.discover_logs(
+        base_path=config.kiro_app_folder,
+        start_date=start_date,
+        end_date=end_date
+    )
+    
+    if not log_files:
+        raise EmptyAnalysisError(
+            f"No log files found in {config.kiro_app_folder} "
+            f"for the period {start_date.date()} to {end_date.date()}"
+        )
+    
+    progress(f"Discovered {len(log_files)} log files")
+    
+    # Step 2: Parse log files
+    parser_service = ParserService(
+        n_workers=config.n_workers,
+        chunksize=config.chunksize,
+        cache_dir=ConfigManager.DEFAULT_PARSE_CACHE_DIR if use_cache else None,
+        # Reports never read raw lines, so skip keeping them in memory
+        store_raw_lines=False
+    )
+    # Entries outside the period are dropped while parsing
+    log_entries = parser_service.parse_files(
+        [f.path for f in log_files],
+        date_range=(start_date, end_date)
+    )
+    
+    if not log_entries:
+        raise EmptyAnalysisError(
+            f"No log entries found for the period {start_date.date()} to {end_date.date()}"
+        )
+    
+    progress(f"Parsed {len(log_entries)} log entries within date range")
+    
+    # Step 3: Analyze log entries
+    analyzer_service = AnalyzerService(default_calculators())
+    metrics = analyzer_service.analyze(
+        log_entries,
+        analysis_period=(start_date, end_date)
+    )
+    
+    # Step 4: Generate report
+    reporter_service = ReporterService()
+    format_enum = ReportFormat(output_format.lower())
+    
+    # Determine output path
+    if output_path is None and format_enum != ReportFormat.CONSOLE:
+        output_path = reporter_service.generate_timestamped_filename(
+            report_name,
+            format_enum,
+            config.output_directory
+        )
+    
+    report_content = reporter_service.generate_report(
+        metrics,
+        format_enum,
+        output_path
+    )
+    
+    return report_content, output_path
@@ -2,9 +2,12 @@
 
 import csv
 import json
+import re
 from datetime import datetime
 from enum import Enum
+from heapq import nlargest
 from io import StringIO
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional
 
@@ -15,6 +18,12 @@ from rich.text import Text
 
 from kiro_analyzer.models import ProductivityMetrics
 
+# Maximum rows shown in the ranked console tables (languages, tools)
+CONSOLE_TOP_N = 50
+
+# Characters that make the csv module quote a field (besides the delimiter)
+_CSV_SPECIAL_CHARS = re.compile(r'["\r\n]')
+
 
 class ReportFormat(Enum):
     """Supported report output formats."""
@@ -78,11 +87,14 @@ class ReporterService:
         Returns:
             Formatted JSON string with metadata and metrics
         """
+        iso = datetime.isoformat
+        period_start, period_end = metrics.analysis_period
+        
         report_data = {
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": iso(datetime.now()),
             "analysis_period": {
-                "start": metrics.analysis_period[0].isoformat(),
-                "end": metrics.analysis_period[1].isoformat()
+                "start": iso(period_start),
+                "end": iso(period_end)
             },
             "metrics": {
                 "total_requests": metrics.total_requests,
@@ -95,8 +107,9 @@ class ReporterService:
                 "lines_by_language": metrics.lines_by_language,
                 "success_rate_percent": metrics.success_rate_percent,
                 "tool_usage": metrics.tool_usage,
+                # Tuples encode as JSON arrays, like lists
                 "peak_activity_periods": [
-                    [start.isoformat(), end.isoformat()]
+                    (iso(start), iso(end))
                     for start, end in metrics.peak_activity_periods
                 ],
                 "daily_breakdown": metrics.daily_breakdown
@@ -108,6 +121,34 @@ class ReporterService:
     def _format_csv(self, metrics: ProductivityMetrics) -> str:
         """Convert ProductivityMetrics to CSV rows.
         
+        Rows are joined directly when no field needs quoting, which produces
+        the same output as csv.DictWriter without its per-field overhead.
+        Otherwise the csv module does the quoting.
+        
+        Args:
+            metrics: The productivity metrics to format
+            
+        Returns:
+            Formatted CSV string with metric_name, value, unit columns
+        """
+        lines = ["metric_name,value,unit"]
+        append = lines.append
+        needs_quoting = _CSV_SPECIAL_CHARS.search
+        
+        for row in metrics.iter_csv_rows():
+            line = f"{row['metric_name']},{row['value']},{row['unit']}"
+            # A line with exactly the two separators added above needs no quoting
+            if line.count(',') != 2 or needs_quoting(line):
+                return self._format_csv_quoted(metrics)
+            append(line)
+        
+        # Match the csv module's default line terminator
+        append("")
+        return "\r\n".join(lines)
+    
+    def _format_csv_quoted(self, metrics: ProductivityMetrics) -> str:
+        """Convert ProductivityMetrics to CSV rows using the csv module.
+        
         Args:
             metrics: The productivity metrics to format
             
@@ -118,9 +159,8 @@ class ReporterService:
         writer = csv.DictWriter(output, fieldnames=["metric_name", "value", "unit"])
         writer.writeheader()
         
-        # Write all rows from the metrics
-        rows = metrics.to_csv_rows()
-        writer.writerows(rows)
+        # Stream rows from the metrics straight into the writer
+        writer.writerows(metrics.iter_csv_rows())
         
         return output.getvalue()
     
@@ -171,8 +211,7 @@ class ReporterService:
             lang_table.add_column("Language", style="cyan")
             lang_table.add_column("Lines", justify="right", style="green")
             
-            for language, count in sorted(metrics.lines_by_language.items(), key=lambda x: x[1], reverse=True):
-                lang_table.add_row(language, str(count))
+            self._add_ranked_rows(lang_table, metrics.lines_by_language)
             
             console.print(lang_table)
             console.print()
@@ -183,8 +222,7 @@ class ReporterService:
             tool_table.add_column("Tool", style="cyan")
             tool_table.add_column("Count", justify="right", style="green")
             
-            for tool_name, count in sorted(metrics.tool_usage.items(), key=lambda x: x[1], reverse=True):
-                tool_table.add_row(tool_name, str(count))
+            self._add_ranked_rows(tool_table, metrics.tool_usage)
             
             console.print(tool_table)
             console.print()
@@ -217,6 +255,24 @@ class ReporterService:
         # Get the string output
         return console.file.getvalue()
     
+    @staticmethod
+    def _add_ranked_rows(table: Table, counts: dict) -> None:
+        """Add the largest counts to a table in descending order.
+        
+        Only the top CONSOLE_TOP_N entries are selected, without sorting the
+        rest. Omitted entries are reported in the table caption.
+        
+        Args:
+            table: Two-column table to add rows to
+            counts: Mapping of names to counts
+        """
+        for name, count in nlargest(CONSOLE_TOP_N, counts.items(), key=itemgetter(1)):
+            table.add_row(name, str(count))
+        
+        omitted = len(counts) - CONSOLE_TOP_N
+        if omitted > 0:
+            table.caption = f"{omitted} more not shown"
+    
     def save_report(self, content: str, output_path: Path) -> None:
         """Save report to file.
         
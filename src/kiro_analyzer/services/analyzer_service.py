@@ -1,11 +1,15 @@
 """Service for analyzing log entries and computing productivity metrics."""
 
+from collections import Counter
 from datetime import datetime
 from typing import List, Tuple
 
 from ..models import LogEntry, ProductivityMetrics
 from ..protocols import MetricCalculator
 
+# Result keys holding integer counts that are summed across calculators
+_COUNT_KEYS = ('lines_by_language', 'tool_usage', 'daily_breakdown')
+
 
 class AnalyzerService:
     """Orchestrates metric calculation from log entries.
@@ -52,11 +56,11 @@ class AnalyzerService:
             'slowest_response_time_seconds': 0.0,
             'total_characters_processed': 0,
             'lines_of_code_generated': 0,
-            'lines_by_language': {},
+            'lines_by_language': Counter(),
             'success_rate_percent': 0.0,
-            'tool_usage': {},
+            'tool_usage': Counter(),
             'peak_activity_periods': [],
-            'daily_breakdown': {}
+            'daily_breakdown': Counter()
         }
         
         # Run all calculators and merge results
@@ -81,11 +85,11 @@ class AnalyzerService:
             slowest_response_time_seconds=aggregated.get('slowest_response_time_seconds', 0.0),
             total_characters_processed=aggregated.get('total_characters_processed', 0),
             lines_of_code_generated=aggregated.get('lines_of_code_generated', 0),
-            lines_by_language=aggregated.get('lines_by_language', {}),
+            lines_by_language=dict(aggregated['lines_by_language']),
             success_rate_percent=aggregated.get('success_rate_percent', 0.0),
-            tool_usage=aggregated.get('tool_usage', {}),
+            tool_usage=dict(aggregated['tool_usage']),
             peak_activity_periods=aggregated.get('peak_activity_periods', []),
-            daily_breakdown=aggregated.get('daily_breakdown', {})
+            daily_breakdown=dict(aggregated['daily_breakdown'])
         )
         
         return metrics
@@ -94,7 +98,9 @@ class AnalyzerService:
         """Merge calculator results into aggregated metrics.
         
         Handles different data types appropriately:
-        - Dictionaries are merged (not replaced)
+        - Count dictionaries (lines_by_language, tool_usage,
+          daily_breakdown) are summed per key
+        - Other dictionaries are merged (not replaced)
         - Lists are replaced (not concatenated)
         - Scalar values are replaced
         
@@ -103,11 +109,14 @@ class AnalyzerService:
             result: New results from a calculator to merge in
         """
         for key, value in result.items():
-            if key not in aggregated:
+            if key in _COUNT_KEYS and isinstance(value, dict):
+                # Counter.update adds counts per key
+                aggregated[key].update(value)
+            elif key not in aggregated:
                 # New key, just add it
                 aggregated[key] = value
             elif isinstance(value, dict) and isinstance(aggregated[key], dict):
-                # Merge dictionaries (for lines_by_language, tool_usage, daily_breakdown)
+                # Merge other dictionaries
                 for sub_key, sub_value in value.items():
                     if sub_key in aggregated[key]:
                         # If key exists, add values (for counts)
@@ -142,26 +151,24 @@ class AnalyzerService:
         Returns:
             Filtered list of log entries within the date range
         """
+        # Normalize the range once; entries are compared as naive datetimes
+        if start_date.tzinfo is not None:
+            start_date = start_date.replace(tzinfo=None)
+        if end_date.tzinfo is not None:
+            end_date = end_date.replace(tzinfo=None)
+        
         filtered = []
+        append = filtered.append
         
         for entry in entries:
-            # Normalize timestamps for comparison
             entry_time = entry.timestamp
             
             # Convert to naive datetime if timezone-aware for comparison
             if entry_time.tzinfo is not None:
                 entry_time = entry_time.replace(tzinfo=None)
             
-            compare_start = start_date
-            compare_end = end_date
-            
-            if compare_start.tzinfo is not None:
-                compare_start = compare_start.replace(tzinfo=None)
-            if compare_end.tzinfo is not None:
-                compare_end = compare_end.replace(tzinfo=None)
-            
             # Check if entry is within range (inclusive)
-            if compare_start <= entry_time <= compare_end:
-                filtered.append(entry)
+            if start_date <= entry_time <= end_date:
+                append(entry)
         
         return filtered
@@ -1,11 +1,15 @@
 """Configuration management for Kiro Activity Analyzer."""
 
-import json
+# json is imported where a config file is actually read or written, so CLI
+# startup does not pay for it when no config file exists
+import logging
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from ..models import AnalyzerConfig
 
+logger = logging.getLogger(__name__)
+
 
 class ConfigManager:
     """Manages configuration loading and saving for the analyzer.
@@ -18,6 +22,9 @@ class ConfigManager:
     DEFAULT_KIRO_APP_FOLDER = Path.home() / "Library" / "Application Support" / "Kiro"
     DEFAULT_DATE_RANGE_DAYS = 7
     DEFAULT_OUTPUT_DIR = Path.home() / ".kiro-analyzer" / "reports"
+    DEFAULT_PARSE_CACHE_DIR = Path.home() / ".kiro-analyzer" / "parse-cache"
+    DEFAULT_N_WORKERS = 1
+    DEFAULT_CHUNKSIZE = 1
     
     def __init__(self, config_path: Optional[Path] = None):
         """Initialize the ConfigManager.
@@ -48,17 +55,22 @@ class ConfigManager:
             "default_date_range_days": self.DEFAULT_DATE_RANGE_DAYS,
             "output_directory": str(self.DEFAULT_OUTPUT_DIR),
             "enabled_metrics": [],
-            "custom_parsers": []
+            "custom_parsers": [],
+            "n_workers": self.DEFAULT_N_WORKERS,
+            "chunksize": self.DEFAULT_CHUNKSIZE
         }
         
         # Try to load from file if it exists
         if self.config_path.exists():
+            import json
+            
             try:
-                with open(self.config_path, 'r') as f:
-                    file_data = json.load(f)
-                    # Update defaults with values from file
-                    config_data.update(file_data)
-            except (json.JSONDecodeError, IOError) as e:
+                # json.loads decodes the bytes itself (UTF-8 per the JSON
+                # spec), skipping a text-mode reader in the locale encoding
+                file_data = json.loads(self.config_path.read_bytes())
+                # Update defaults with values from file
+                config_data.update(file_data)
+            except (json.JSONDecodeError, UnicodeDecodeError, IOError) as e:
                 # If file is corrupted or unreadable, use defaults
                 # Could log a warning here in the future
                 pass
@@ -69,9 +81,31 @@ class ConfigManager:
             default_date_range_days=config_data["default_date_range_days"],
             output_directory=Path(config_data["output_directory"]),
             enabled_metrics=config_data["enabled_metrics"],
-            custom_parsers=config_data["custom_parsers"]
+            custom_parsers=config_data["custom_parsers"],
+            n_workers=self._int_setting(config_data, "n_workers", self.DEFAULT_N_WORKERS),
+            chunksize=self._int_setting(config_data, "chunksize", self.DEFAULT_CHUNKSIZE)
         )
     
+    def _int_setting(self, config_data: Dict[str, Any], name: str, default: int) -> int:
+        """Read an integer setting, falling back to its default if invalid.
+        
+        Args:
+            config_data: Merged configuration values
+            name: Setting name
+            default: Value used when the setting cannot be converted to int
+            
+        Returns:
+            The setting as an int
+        """
+        value = config_data[name]
+        try:
+            return int(value)
+        except (ValueError, TypeError):
+            logger.warning(
+                "Invalid %s %r in %s; using default %d", name, value, self.config_path, default
+            )
+            return default
+    
     def save_config(self, config: AnalyzerConfig) -> None:
         """Save configuration to file.
         
@@ -93,9 +127,13 @@ class ConfigManager:
             "default_date_range_days": config.default_date_range_days,
             "output_directory": str(config.output_directory),
             "enabled_metrics": config.enabled_metrics,
-            "custom_parsers": config.custom_parsers
+            "custom_parsers": config.custom_parsers,
+            "n_workers": config.n_workers,
+            "chunksize": config.chunksize
         }
         
         # Write to file with pretty formatting
+        import json
+        
         with open(self.config_path, 'w') as f:
             json.dump(config_data, f, indent=2)
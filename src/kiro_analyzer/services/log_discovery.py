@@ -3,7 +3,7 @@
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 from ..models import LogFileMetadata
 
@@ -29,6 +29,26 @@ class LogDiscoveryService:
         "README.md": "Project documentation",
     }
     
+    # Directory names never searched: they hold VCS data, bytecode,
+    # third-party packages or the Electron/Chromium caches found in the
+    # Kiro application folder, rather than Kiro logs
+    IGNORED_DIRECTORIES = frozenset({
+        '.git', '__pycache__', 'node_modules',
+        'Cache', 'CachedData', 'Code Cache', 'GPUCache', 'Service Worker', 'blob_storage',
+    })
+    
+    # Recognized file extensions, lowercase
+    _LOG_EXTENSIONS = ('.log', '.json', '.md')
+    
+    # Name keywords and the file type they indicate, in priority order
+    _FILE_TYPE_KEYWORDS = (
+        ('activity', 'activity'),
+        ('metrics', 'metrics'),
+        ('session', 'session'),
+        ('kiro', 'kiro_agent'),
+        ('q-client', 'kiro_agent'),
+    )
+    
     def __init__(self, base_path: Optional[Path] = None):
         """Initialize the log discovery service.
         
@@ -73,34 +93,78 @@ class LogDiscoveryService:
         
         discovered_files: List[LogFileMetadata] = []
         
-        # Recursively walk through the directory
-        for root, _, files in os.walk(search_path):
-            root_path = Path(root)
+        # Compare modification times as POSIX timestamps, so files outside
+        # the range are rejected before any metadata objects are built
+        start_ts = start_date.timestamp() if start_date is not None else None
+        end_ts = end_date.timestamp() if end_date is not None else None
+        
+        # Recursively walk through the directory. scandir entries carry the
+        # name from the directory read, and each file is stat-ed only once.
+        for entry in self._walk_files(str(search_path)):
+            # Check if file matches recognized patterns
+            if not self._matches_log_name(entry.name):
+                continue
             
-            for filename in files:
-                file_path = root_path / filename
-                
-                # Check if file matches recognized patterns
-                if self._matches_log_pattern(file_path):
-                    try:
-                        metadata = self._extract_metadata(file_path)
-                        
-                        # Filter by date range if specified
-                        if self._is_within_date_range(metadata, start_date, end_date):
-                            discovered_files.append(metadata)
-                    except (OSError, PermissionError):
-                        # Skip files we can't access
-                        continue
+            try:
+                stat_info = entry.stat()
+            except OSError:
+                # Skip files we can't access
+                continue
+            
+            # Filter by date range if specified
+            mod_time = stat_info.st_mtime
+            if start_ts is not None and mod_time < start_ts:
+                continue
+            if end_ts is not None and mod_time > end_ts:
+                continue
+            
+            discovered_files.append(self._extract_metadata(Path(entry.path), stat_info))
         
         return discovered_files
     
-    def get_log_patterns(self) -> Dict[str, str]:
+    def _walk_files(self, directory: str) -> Iterator[os.DirEntry]:
+        """Recursively yield the non-directory entries below a directory.
+        
+        Mirrors os.walk: a directory's files are yielded before its
+        subdirectories are searched, symlinked directories are not followed
+        and unreadable directories are skipped.
+        
+        Args:
+            directory: Directory to search
+            
+        Yields:
+            os.DirEntry for each file found
+        """
+        subdirectories = []
+        
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    
+                    if not is_dir:
+                        yield entry
+                    elif not entry.is_symlink() and entry.name not in self.IGNORED_DIRECTORIES:
+                        subdirectories.append(entry.path)
+        except OSError:
+            return
+        
+        for subdirectory in subdirectories:
+            yield from self._walk_files(subdirectory)
+    
+    @classmethod
+    def get_log_patterns(cls) -> Dict[str, str]:
         """Return dictionary of recognized log file patterns and descriptions.
         
+        A classmethod, since the patterns do not depend on the search path.
+        
         Returns:
             Dictionary mapping file patterns to their descriptions
         """
-        return self.LOG_PATTERNS.copy()
+        return cls.LOG_PATTERNS.copy()
     
     def _matches_log_pattern(self, file_path: Path) -> bool:
         """Check if a file matches any recognized log pattern.
@@ -111,19 +175,30 @@ class LogDiscoveryService:
         Returns:
             True if the file matches a log pattern, False otherwise
         """
-        filename = file_path.name.lower()
-        
-        # Check for .log, .json, or .md extensions
-        if not (filename.endswith('.log') or filename.endswith('.json') or filename.endswith('.md')):
-            return False
+        return self._matches_log_name(file_path.name)
+    
+    def _matches_log_name(self, name: str) -> bool:
+        """Check if a file name matches any recognized log pattern.
         
-        return True
+        Args:
+            name: File name to check
+            
+        Returns:
+            True if the name matches a log pattern, False otherwise
+        """
+        # Check for .log, .json, or .md extensions. Lowercase names match
+        # without allocating; only the extension is lowercased otherwise.
+        return (
+            name.endswith(self._LOG_EXTENSIONS)
+            or name[-5:].lower().endswith(self._LOG_EXTENSIONS)
+        )
     
-    def _extract_metadata(self, file_path: Path) -> LogFileMetadata:
+    def _extract_metadata(self, file_path: Path, stat_info: Optional[os.stat_result] = None) -> LogFileMetadata:
         """Extract metadata from a log file.
         
         Args:
             file_path: Path to the log file
+            stat_info: Already-fetched stat result for the file, if any
             
         Returns:
             LogFileMetadata object with file information
@@ -131,7 +206,8 @@ class LogDiscoveryService:
         Raises:
             OSError: If file stats cannot be retrieved
         """
-        stat_info = file_path.stat()
+        if stat_info is None:
+            stat_info = file_path.stat()
         
         # Determine file type based on filename patterns
         file_type = self._determine_file_type(file_path)
@@ -157,16 +233,12 @@ class LogDiscoveryService:
         
         if filename_lower.endswith('.md'):
             return 'documentation'
-        elif 'activity' in filename_lower:
-            return 'activity'
-        elif 'metrics' in filename_lower:
-            return 'metrics'
-        elif 'session' in filename_lower:
-            return 'session'
-        elif 'kiro' in filename_lower.lower() or 'q-client' in filename_lower:
-            return 'kiro_agent'
-        else:
-            return 'general'
+        
+        for keyword, file_type in self._FILE_TYPE_KEYWORDS:
+            if keyword in filename_lower:
+                return file_type
+        
+        return 'general'
     
     def _is_within_date_range(
         self,
@@ -1,10 +1,48 @@
 """Utility for extracting project information from log entries."""
 
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 from ..models import LogEntry
 
+# Common parent directories that do not identify a project
+_SKIP_DIRS = frozenset({'Users', 'home', 'Documents', 'Projects', 'Code', 'src', 'workspace'})
+
+# Fields holding a project path, in priority order
+_PATH_KEYS = ('workspace_path', 'working_directory', 'cwd')
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=4096)
+def _project_from_path(path_str: str) -> str:
+    """Extract a project name from a path string, memoized.
+    
+    A session logs the same workspace path on many entries, so results are
+    cached per path string. Names are interned, so different paths naming
+    the same project share one string.
+    
+    Args:
+        path_str: Non-empty file path string
+        
+    Returns:
+        Project name extracted from path
+    """
+    path = Path(path_str)
+    # Get the last directory name (project root)
+    if path.is_absolute():
+        # Find the meaningful project directory
+        # Skip common parent directories like 'Documents', 'Projects', etc.
+        # Work backwards to find a meaningful directory name
+        for part in reversed(path.parts):
+            if part and part not in _SKIP_DIRS and not part.startswith('.'):
+                return sys.intern(part)
+    
+    # Fallback to the name of the path
+    return sys.intern(path.name) if path.name else 'unknown'
+
 
 class ProjectExtractor:
     """Extract project/workspace information from log entries.
@@ -30,28 +68,23 @@ class ProjectExtractor:
         Returns:
             Project name/identifier or None if not found
         """
-        # Check for explicit project name
-        if 'project_name' in entry.data:
-            return str(entry.data['project_name'])
+        data_get = entry.data.get
         
-        # Check for workspace path
-        if 'workspace_path' in entry.data:
-            workspace_path = entry.data['workspace_path']
-            return ProjectExtractor._extract_from_path(workspace_path)
-        
-        # Check for working directory
-        if 'working_directory' in entry.data:
-            working_dir = entry.data['working_directory']
-            return ProjectExtractor._extract_from_path(working_dir)
+        # Check for explicit project name
+        project_name = data_get('project_name', _MISSING)
+        if project_name is not _MISSING:
+            return str(project_name)
         
-        # Check for cwd
-        if 'cwd' in entry.data:
-            cwd = entry.data['cwd']
-            return ProjectExtractor._extract_from_path(cwd)
+        # Check for workspace path, working directory and cwd, in that order;
+        # one lookup per key, with a present-but-empty value still winning
+        for key in _PATH_KEYS:
+            path_value = data_get(key, _MISSING)
+            if path_value is not _MISSING:
+                return ProjectExtractor._extract_from_path(path_value)
         
         # Check for workspace in nested context
-        if 'context' in entry.data and isinstance(entry.data['context'], dict):
-            context = entry.data['context']
+        context = data_get('context')
+        if isinstance(context, dict):
             if 'workspace' in context:
                 return ProjectExtractor._extract_from_path(context['workspace'])
             if 'project' in context:
@@ -75,20 +108,7 @@ class ProjectExtractor:
             return 'unknown'
         
         try:
-            path = Path(path_str)
-            # Get the last directory name (project root)
-            if path.is_absolute():
-                # Find the meaningful project directory
-                # Skip common parent directories like 'Documents', 'Projects', etc.
-                parts = path.parts
-                skip_dirs = {'Users', 'home', 'Documents', 'Projects', 'Code', 'src', 'workspace'}
-                
-                # Work backwards to find a meaningful directory name
-                for part in reversed(parts):
-                    if part and part not in skip_dirs and not part.startswith('.'):
-                        return part
-            
-            # Fallback to the name of the path
-            return path.name if path.name else 'unknown'
+            return _project_from_path(path_str)
         except Exception:
+            # Includes unhashable values, which the cache cannot key on
             return 'unknown'
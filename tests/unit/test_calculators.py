@@ -13,6 +13,7 @@ from kiro_analyzer.analyzers import (
     ResponseTimeCalculator,
     ToolUsageCalculator,
 )
+from kiro_analyzer.models import LogEntry
 from kiro_analyzer.parsers import ParserService
 
 
@@ -204,6 +205,53 @@ class TestActivityPatternCalculator:
             assert start < end
 
 
+class TestActivityPatternPeakPeriods:
+    """Tests for peak period detection using synthetic entries."""
+    
+    @staticmethod
+    def _entry(timestamp: datetime) -> LogEntry:
+        return LogEntry(
+            timestamp=timestamp,
+            event_type='request',
+            data={},
+            raw_line='',
+            source_file=Path('test.log')
+        )
+    
+    def test_overlapping_two_hour_windows(self):
+        """Test that peaks are ranked by count across overlapping windows."""
+        base = datetime(2025, 11, 15, 9, 30)
+        offsets = [0, 40, 70, 80, 90, 200, 600]  # minutes after base
+        entries = [self._entry(base + timedelta(minutes=m)) for m in reversed(offsets)]
+        
+        calculator = ActivityPatternCalculator()
+        peaks = calculator.calculate(entries)['peak_activity_periods']
+        
+        assert peaks == [
+            (datetime(2025, 11, 15, 9, 0), datetime(2025, 11, 15, 11, 0)),
+            (datetime(2025, 11, 15, 10, 0), datetime(2025, 11, 15, 12, 0)),
+            (datetime(2025, 11, 15, 11, 0), datetime(2025, 11, 15, 13, 0)),
+        ]
+    
+    def test_sparse_entries_far_apart(self):
+        """Test that empty stretches between entries produce no windows."""
+        entries = [
+            self._entry(datetime(2025, 1, 1, 8, 15)),
+            self._entry(datetime(2025, 6, 1, 8, 15)),
+        ]
+        
+        calculator = ActivityPatternCalculator()
+        peaks = calculator.calculate(entries)['peak_activity_periods']
+        
+        assert len(peaks) == 3
+        assert all(end - start == timedelta(hours=2) for start, end in peaks)
+        assert [start for start, _ in peaks] == [
+            datetime(2025, 1, 1, 8, 0),
+            datetime(2025, 6, 1, 7, 0),
+            datetime(2025, 6, 1, 8, 0),
+        ]
+
+
 @pytest.mark.skipif(not KIRO_APP_FOLDER.exists(), reason="Kiro application folder not found")
 class TestCharacterCountCalculator:
     """Tests for CharacterCountCalculator using real data."""
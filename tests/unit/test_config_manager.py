@@ -96,6 +96,42 @@ class TestConfigManager:
             assert config.kiro_app_folder == ConfigManager.DEFAULT_KIRO_APP_FOLDER
             assert config.default_date_range_days == ConfigManager.DEFAULT_DATE_RANGE_DAYS
     
+    def test_load_config_with_non_utf8_file_returns_defaults(self):
+        """Test that a config file that is not valid UTF-8 results in default config."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.json"
+            config_path.write_bytes(b'{"kiro_app_folder": "\xff\xfe"}')
+            
+            manager = ConfigManager(config_path)
+            config = manager.load_config()
+            
+            assert config.kiro_app_folder == ConfigManager.DEFAULT_KIRO_APP_FOLDER
+    
+    def test_load_config_with_invalid_worker_settings_uses_defaults(self, caplog):
+        """Test that non-integer n_workers/chunksize fall back to defaults with a warning."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.json"
+            config_path.write_text(json.dumps({"n_workers": "many", "chunksize": None}))
+            
+            manager = ConfigManager(config_path)
+            config = manager.load_config()
+            
+            assert config.n_workers == ConfigManager.DEFAULT_N_WORKERS
+            assert config.chunksize == ConfigManager.DEFAULT_CHUNKSIZE
+            assert "Invalid n_workers 'many'" in caplog.text
+            assert "Invalid chunksize None" in caplog.text
+    
+    def test_load_config_coerces_numeric_worker_settings(self):
+        """Test that numeric strings for n_workers/chunksize are converted to int."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.json"
+            config_path.write_text(json.dumps({"n_workers": "4", "chunksize": 2}))
+            
+            config = ConfigManager(config_path).load_config()
+            
+            assert config.n_workers == 4
+            assert config.chunksize == 2
+    
     def test_save_config_creates_directory(self):
         """Test that save_config creates parent directory if it doesn't exist."""
         with tempfile.TemporaryDirectory() as tmpdir:
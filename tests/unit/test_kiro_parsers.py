@@ -39,6 +39,18 @@ class TestKiroLogParser:
         assert len(entries) == 2
         assert entries[0].event_type == 'conversation_start'
         assert entries[0].data.get('autonomy_mode') == 'Supervised'
+        assert entries[0].timestamp == datetime(2025, 11, 19, 23, 3, 58, 159000)
+    
+    def test_skips_invalid_timestamp(self, tmp_path):
+        """Test that a well-formed line with an impossible date is skipped."""
+        parser = KiroLogParser()
+        log_file = tmp_path / "kiro.kiroAgent" / "test.log"
+        log_file.parent.mkdir(parents=True)
+        
+        log_file.write_text("2025-13-19 23:03:58.159 [info] Bad month\n2025-11-19 23:03:59.598 [info] Fine")
+        
+        entries = list(parser.parse(log_file))
+        assert [e.data['message'] for e in entries] == ['Fine']
     
     def test_extract_tool_usage(self, tmp_path):
         """Test extracting tool usage from Kiro logs."""
@@ -53,6 +65,22 @@ class TestKiroLogParser:
         assert len(entries) == 1
         assert entries[0].event_type == 'tool_invocation'
         assert entries[0].data.get('tool_invocation') is True
+    
+    def test_extract_json_payload(self, tmp_path):
+        """Test that the outermost {...} span of a message is parsed as JSON."""
+        parser = KiroLogParser()
+        log_file = tmp_path / "kiro.kiroAgent" / "test.log"
+        log_file.parent.mkdir(parents=True)
+        
+        log_file.write_text(
+            '2025-11-19 23:08:09.520 [info] Response: {"conversationId": "c1", "modelId": "m"} done\n'
+            '2025-11-19 23:08:10.520 [info] Not JSON: {broken} and {"a": 1}\n'
+        )
+        
+        entries = list(parser.parse(log_file))
+        assert entries[0].data['json_payload'] == {"conversationId": "c1", "modelId": "m"}
+        assert entries[0].data['conversation_id'] == 'c1'
+        assert 'json_payload' not in entries[1].data
 
 
 class TestMarkdownParser:
@@ -131,6 +131,27 @@ class TestLogDiscoveryService:
             assert len(discovered) == 1
             assert discovered[0].path.name == "recent.log"
     
+    def test_discover_logs_filters_by_end_date_inclusive(self):
+        """Test that end_date excludes newer files and includes its own instant."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            
+            boundary_file = tmp_path / "boundary.log"
+            newer_file = tmp_path / "newer.log"
+            boundary_file.touch()
+            newer_file.touch()
+            
+            end_date = datetime.now().replace(microsecond=0) - timedelta(days=3)
+            newer_time = (end_date + timedelta(days=1)).timestamp()
+            os.utime(boundary_file, (end_date.timestamp(), end_date.timestamp()))
+            os.utime(newer_file, (newer_time, newer_time))
+            
+            service = LogDiscoveryService(base_path=tmp_path)
+            discovered = service.discover_logs(end_date=end_date)
+            
+            assert [f.path.name for f in discovered] == ["boundary.log"]
+            assert discovered[0].modified_at == end_date
+    
     def test_discover_logs_recursive_search(self):
         """Test that discover_logs searches subdirectories recursively."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -150,3 +171,21 @@ class TestLogDiscoveryService:
             filenames = {f.path.name for f in discovered}
             assert "root.log" in filenames
             assert "nested.log" in filenames
+    
+    def test_discover_logs_skips_ignored_directories(self):
+        """Test that VCS, dependency and cache directories are not searched."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            
+            (tmp_path / ".git").mkdir()
+            (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+            (tmp_path / ".git" / "hook.log").touch()
+            (tmp_path / "node_modules" / "pkg" / "README.md").touch()
+            (tmp_path / "Code Cache" / "js").mkdir(parents=True)
+            (tmp_path / "Code Cache" / "js" / "index.json").touch()
+            (tmp_path / "kept.log").touch()
+            
+            service = LogDiscoveryService(base_path=tmp_path)
+            discovered = service.discover_logs()
+            
+            assert [f.path.name for f in discovered] == ["kept.log"]
@@ -1,6 +1,7 @@
 """Unit tests for model usage calculator."""
 
 import json
+import os
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -36,6 +37,32 @@ class TestModelUsageCalculator:
         finally:
             temp_path.unlink()
     
+    def test_read_settings_without_entries(self, tmp_path):
+        """Test reading model settings directly without analyzing logs."""
+        settings_path = tmp_path / 'settings.json'
+        settings_path.write_text(json.dumps({'kiroAgent.modelSelection': 'claude-haiku'}))
+        
+        calculator = ModelUsageCalculator(kiro_user_settings_path=settings_path)
+        settings = calculator.read_settings()
+        
+        assert settings['modelSelection'] == 'claude-haiku'
+        assert settings['agentModelSelection'] is None
+        assert calculator.calculate([])['models_used'] == {}
+    
+    def test_settings_reloaded_when_file_changes(self, tmp_path):
+        """Test that cached settings are refreshed after settings.json changes."""
+        settings_path = tmp_path / 'settings.json'
+        settings_path.write_text(json.dumps({'kiroAgent.modelSelection': 'model-a'}))
+        
+        calculator = ModelUsageCalculator(kiro_user_settings_path=settings_path)
+        assert calculator.calculate([])['configured_model'] == 'model-a'
+        
+        mtime_ns = settings_path.stat().st_mtime_ns
+        settings_path.write_text(json.dumps({'kiroAgent.modelSelection': 'model-b'}))
+        os.utime(settings_path, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+        
+        assert calculator.calculate([])['configured_model'] == 'model-b'
+    
     def test_track_model_usage_from_logs(self):
         """Test tracking model usage from log entries."""
         entries = [
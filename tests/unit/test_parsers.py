@@ -1,6 +1,7 @@
 """Unit tests for log parsers."""
 
 import json
+import re
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -14,6 +15,56 @@ from kiro_analyzer.parsers import (
     ParserService
 )
 from kiro_analyzer.models import LogEntry
+from kiro_analyzer.parsers import parser_service
+from kiro_analyzer.parsers.base import iter_byte_chunks, stream_file_lines, stream_range
+from kiro_analyzer.parsers.parse_cache import ParseCache
+from kiro_analyzer.services.analyzer_service import AnalyzerService
+
+
+class TestStreamingHelpers:
+    """Tests for line streaming and byte-range helpers in parsers.base."""
+    
+    def test_ranges_cover_every_line_once(self, tmp_path):
+        """Test that ranges start on lines and together yield every line."""
+        lines = [f"line {i} " + "x" * (i % 7) for i in range(50)]
+        log_file = tmp_path / "test.log"
+        log_file.write_text('\n'.join(lines) + '\n')
+        
+        ranges = iter_byte_chunks(log_file, 4)
+        
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == log_file.stat().st_size
+        assert all(end == next_start for (_, end), (next_start, _) in zip(ranges, ranges[1:]))
+        
+        streamed = [line for start, end in ranges for line in stream_range(log_file, start, end)]
+        assert streamed == lines
+    
+    def test_stream_file_lines_binary(self, tmp_path):
+        """Test that binary streaming yields undecoded lines without newlines."""
+        log_file = tmp_path / "test.log"
+        log_file.write_bytes(b'first\r\nsecond\n\nthird')
+        
+        assert list(stream_file_lines(log_file, binary=True)) == [b'first', b'second', b'', b'third']
+        assert list(stream_file_lines(log_file)) == ['first', 'second', '', 'third']
+    
+    def test_carriage_return_line_endings(self, tmp_path):
+        """Test that ranges split lone CR line endings like text-mode streaming."""
+        log_file = tmp_path / "test.log"
+        log_file.write_bytes(b'first\rsecond\r\rthird\r\nfourth\nfifth\r\r\nsixth\r')
+        
+        expected = ['first', 'second', '', 'third', 'fourth', 'fifth', '', 'sixth']
+        assert list(stream_file_lines(log_file)) == expected
+        
+        ranges = iter_byte_chunks(log_file, 3)
+        streamed = [line for start, end in ranges for line in stream_range(log_file, start, end)]
+        assert streamed == expected
+    
+    def test_empty_file_has_no_ranges(self, tmp_path):
+        """Test that an empty file produces no ranges."""
+        log_file = tmp_path / "empty.log"
+        log_file.write_text('')
+        
+        assert iter_byte_chunks(log_file, 4) == []
 
 
 class TestJSONLogParser:
@@ -68,6 +119,34 @@ class TestJSONLogParser:
         assert len(parsed) == 2
         assert parsed[0].event_type == "valid"
         assert parsed[1].event_type == "also_valid"
+    
+    def test_parse_repeated_timestamps(self, tmp_path):
+        """Test that repeated timestamps parse to the same value."""
+        parser = JSONLogParser()
+        log_file = tmp_path / "test.json"
+        log_file.write_text(
+            '{"timestamp": "2025-11-19T10:00:00Z", "event": "a"}\n'
+            '{"timestamp": "2025-11-19T10:00:00Z", "event": "b"}\n'
+            '{"time": "2025-11-19T10:00:01Z", "event": "c"}\n'
+            '{"timestamp": "2025-11-19T10:00:00Z", "event": "d"}\n'
+        )
+        
+        parsed = list(parser.parse(log_file))
+        assert [e.timestamp.second for e in parsed] == [0, 0, 1, 0]
+        assert parsed[0].timestamp is parsed[1].timestamp
+    
+    def test_parse_interns_repeated_names(self, tmp_path):
+        """Test that event types and tool names are shared across entries."""
+        parser = JSONLogParser()
+        log_file = tmp_path / "test.json"
+        log_file.write_text('\n'.join(
+            json.dumps({"timestamp": "2025-11-19T10:00:00Z", "event": "tool_call", "tool_name": "read_file"})
+            for _ in range(2)
+        ))
+        
+        first, second = parser.parse(log_file)
+        assert first.event_type is second.event_type
+        assert first.data["tool_name"] is second.data["tool_name"]
 
 
 class TestPlainTextLogParser:
@@ -108,6 +187,36 @@ class TestPlainTextLogParser:
         assert len(parsed) == 2
         assert parsed[0].event_type == "INFO"
         assert parsed[1].event_type == "ERROR"
+    
+    def test_parse_mixed_formats_and_custom_pattern(self, tmp_path):
+        """Test that built-in formats and an added pattern are all recognized."""
+        parser = PlainTextLogParser()
+        parser.add_pattern(re.compile(
+            r'^(?P<event_type>\w+)@(?P<timestamp>\S+) (?P<message>.*)'
+        ))
+        log_file = tmp_path / "test.log"
+        
+        log_file.write_text(
+            "[2025-11-19T10:00:00Z] [INFO] bracketed\n"
+            "2025-11-19T10:01:00Z ERROR: colon\n"
+            "2025-11-19 10:02:00 - DEBUG - dash\n"
+            "AUDIT@2025-11-19T10:03:00 custom\n"
+            "unstructured line\n"
+        )
+        
+        parsed = list(parser.parse(log_file))
+        assert [e.event_type for e in parsed] == ["INFO", "ERROR", "DEBUG", "AUDIT"]
+        assert [e.data["message"] for e in parsed] == ["bracketed", "colon", "dash", "custom"]
+        assert [e.timestamp.minute for e in parsed] == [0, 1, 2, 3]
+    
+    def test_parse_timestamp_fallback_formats(self):
+        """Test timestamps that need a strptime fallback."""
+        parser = PlainTextLogParser()
+        assert parser._parse_timestamp("2025-11-19T10:00:00Z").hour == 10
+        assert parser._parse_timestamp("2025-1-9 3:04:05") == datetime(2025, 1, 9, 3, 4, 5)
+        assert parser._parse_timestamp("19/Nov/2025:10:00:00") == datetime(2025, 11, 19, 10)
+        assert parser._parse_timestamp("2025/11/19 10:00:00") == datetime(2025, 11, 19, 10)
+        assert parser._parse_timestamp("not a time") is None
 
 
 class TestParserRegistry:
@@ -129,6 +238,28 @@ class TestParserRegistry:
         registry = ParserRegistry()
         parser = registry.get_parser(Path("test.xyz"))
         assert parser is None
+    
+    def test_parser_selection_cached_until_file_changes(self, tmp_path, monkeypatch):
+        """Test that content sniffing runs once per file version."""
+        registry = ParserRegistry()
+        json_parser = JSONLogParser()
+        text_parser = PlainTextLogParser()
+        registry.register_parser(json_parser)
+        registry.register_parser(text_parser)
+        
+        sniffs = []
+        can_parse = json_parser.can_parse
+        monkeypatch.setattr(json_parser, "can_parse", lambda path: sniffs.append(path) or can_parse(path))
+        
+        log_file = tmp_path / "app.log"
+        log_file.write_text('{"timestamp": "2025-11-19T10:00:00Z"}\n')
+        assert registry.get_parser(log_file) is json_parser
+        assert registry.get_parser(log_file) is json_parser
+        assert len(sniffs) == 1
+        
+        log_file.write_text("2025-11-19T10:00:00Z INFO: plain text now\n")
+        assert registry.get_parser(log_file) is text_parser
+        assert len(sniffs) == 2
 
 
 class TestParserService:
@@ -167,3 +298,162 @@ class TestParserService:
         
         parsed = service.parse_files([file1, file2])
         assert len(parsed) == 2
+    
+    def test_parse_files_in_worker_processes(self, tmp_path):
+        """Test that parallel parsing returns the same entries in file order."""
+        files = []
+        for i in range(4):
+            log_file = tmp_path / f"test{i}.json"
+            log_file.write_text(
+                f'{{"timestamp": "2025-11-19T10:0{i}:00Z", "event": "test{i}"}}'
+            )
+            files.append(log_file)
+        files.append(tmp_path / "missing.json")
+        
+        serial = ParserService().parse_files(files)
+        parallel = ParserService(n_workers=2).parse_files(files)
+        
+        assert [e.event_type for e in parallel] == [e.event_type for e in serial]
+        assert [e.timestamp for e in parallel] == [e.timestamp for e in serial]
+        assert len(parallel) == 4
+    
+    def test_large_file_split_across_workers(self, tmp_path):
+        """Test that a sharded file parses to the same entries as a serial parse."""
+        log_file = tmp_path / "big.jsonl"
+        log_file.write_text('\n'.join(
+            json.dumps({"timestamp": f"2025-11-19T10:{i % 60:02d}:00Z", "event": f"e{i}"})
+            for i in range(200)
+        ))
+        
+        service = ParserService(n_workers=3)
+        service.SHARD_MIN_BYTES = 0
+        
+        tasks, _ = service._plan_tasks([log_file])
+        assert len(tasks) == 3
+        parsed = service.parse_files([log_file])
+        assert [e.event_type for e in parsed] == [f"e{i}" for i in range(200)]
+    
+    def test_parse_cache_reused_until_file_changes(self, tmp_path, monkeypatch):
+        """Test that cached entries are returned until the file is modified."""
+        log_file = tmp_path / "test.json"
+        log_file.write_text('{"timestamp": "2025-11-19T10:00:00Z", "event": "first"}')
+        cache_dir = tmp_path / "cache"
+        
+        service = ParserService(cache_dir=cache_dir)
+        assert [e.event_type for e in service.parse_files([log_file])] == ["first"]
+        assert len(list(cache_dir.glob("*.pickle"))) == 1
+        
+        # A cache hit does not parse the file again
+        def fail_parse(self, file_path):
+            raise AssertionError("parsed despite a cache hit")
+        
+        with monkeypatch.context() as patch:
+            patch.setattr(JSONLogParser, 'parse', fail_parse)
+            cached_service = ParserService(cache_dir=cache_dir)
+            assert [e.event_type for e in cached_service.parse_files([log_file])] == ["first"]
+        
+        # Entries are only served to services with the same parsers
+        other_service = ParserService(registry=ParserRegistry(), cache_dir=cache_dir)
+        assert other_service.parse_files([log_file]) == []
+        
+        log_file.write_text('{"timestamp": "2025-11-19T10:00:00Z", "event": "second!"}')
+        assert [e.event_type for e in service.parse_files([log_file])] == ["second!"]
+        
+        # The entry for the file's previous state is replaced, not orphaned
+        assert len(list(cache_dir.glob("*.pickle"))) == 1
+    
+    def test_parse_cache_evicts_least_recently_used(self, tmp_path):
+        """Test that the cache directory is pruned to its size cap."""
+        cache = ParseCache(tmp_path / "cache", max_bytes=1)
+        log_files = []
+        for i in range(3):
+            log_file = tmp_path / f"test{i}.json"
+            log_file.write_text("{}")
+            log_files.append(log_file)
+            cache.store(cache.key_for(log_file), [])
+        
+        # Over the cap, only the entry just stored survives
+        assert [p.stem for p in cache.cache_dir.glob("*.pickle")] == [cache.key_for(log_files[2])]
+        
+        cache.max_bytes = 10 ** 6
+        cache.store(cache.key_for(log_files[0]), [])
+        assert cache.load(cache.key_for(log_files[0])) == []
+        assert len(list(cache.cache_dir.glob("*.pickle"))) == 2
+    
+    def test_sharded_file_changed_during_parse_is_not_cached(self, tmp_path, monkeypatch):
+        """Test that a file appended to while its ranges are parsed is not cached."""
+        log_file = tmp_path / "big.jsonl"
+        log_file.write_text('\n'.join(
+            json.dumps({"timestamp": "2025-11-19T10:00:00Z", "event": f"e{i}"})
+            for i in range(30)
+        ) + '\n')
+        cache_dir = tmp_path / "cache"
+        
+        def chunks_then_append(file_path, n):
+            # The ranges are planned, then the log grows before it is parsed
+            chunks = iter_byte_chunks(file_path, n)
+            with open(file_path, 'a') as f:
+                f.write(json.dumps({"timestamp": "2025-11-19T11:00:00Z", "event": "late"}) + '\n')
+            return chunks
+        
+        monkeypatch.setattr(parser_service, 'iter_byte_chunks', chunks_then_append)
+        service = ParserService(n_workers=3, cache_dir=cache_dir)
+        service.SHARD_MIN_BYTES = 0
+        
+        assert len(service.parse_files([log_file])) == 30
+        assert list(cache_dir.glob("*.pickle")) == []
+        
+        # The next run parses the file again and sees the appended line
+        monkeypatch.undo()
+        parsed = ParserService(cache_dir=cache_dir).parse_files([log_file])
+        assert parsed[-1].event_type == "late"
+    
+    def test_range_parser_selection_failure_is_skipped(self, tmp_path, monkeypatch):
+        """Test that an error while choosing a range's parser skips the range."""
+        log_file = tmp_path / "big.jsonl"
+        log_file.write_text('{"timestamp": "2025-11-19T10:00:00Z", "event": "test"}\n')
+        
+        def unreadable(file_path):
+            raise PermissionError("denied")
+        
+        service = ParserService()
+        monkeypatch.setattr(service.registry, 'get_parser', unreadable)
+        
+        assert service._parse_range_or_skip(log_file, 0, log_file.stat().st_size) is None
+    
+    def test_parse_without_raw_lines(self, tmp_path):
+        """Test that raw lines can be dropped without sharing cached entries."""
+        log_file = tmp_path / "test.json"
+        log_file.write_text('{"timestamp": "2025-11-19T10:00:00Z", "event": "test"}')
+        cache_dir = tmp_path / "cache"
+        
+        lean = ParserService(cache_dir=cache_dir, store_raw_lines=False).parse_files([log_file])
+        assert lean[0].raw_line == ''
+        assert lean[0].data["event"] == "test"
+        
+        full = ParserService(cache_dir=cache_dir).parse_files([log_file])
+        assert full[0].raw_line.startswith('{"timestamp"')
+        assert len(list(cache_dir.glob("*.pickle"))) == 2
+    
+    def test_parse_files_with_date_range(self, tmp_path):
+        """Test that a date range keeps the same entries as filter_by_date_range."""
+        log_file = tmp_path / "big.jsonl"
+        log_file.write_text('\n'.join(
+            json.dumps({"timestamp": f"2025-11-{19 + i % 3}T10:00:00Z", "event": f"e{i}"})
+            for i in range(30)
+        ))
+        cache_dir = tmp_path / "cache"
+        start, end = datetime(2025, 11, 20), datetime(2025, 11, 20, 23, 59, 59)
+        
+        expected = AnalyzerService([]).filter_by_date_range(
+            ParserService().parse_files([log_file]), start, end
+        )
+        assert len(expected) == 10
+        
+        for service in (ParserService(), ParserService(n_workers=3), ParserService(n_workers=3, cache_dir=cache_dir)):
+            service.SHARD_MIN_BYTES = 0
+            parsed = service.parse_files([log_file], date_range=(start, end))
+            assert [e.event_type for e in parsed] == [e.event_type for e in expected]
+        
+        # The cache keeps every entry, not just the filtered ones
+        assert len(ParserService(cache_dir=cache_dir).parse_files([log_file])) == 30
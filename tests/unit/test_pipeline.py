@@ -0,0 +1,47 @@
+"""Unit tests for the shared analysis pipeline."""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from kiro_analyzer.models import AnalyzerConfig
+from kiro_analyzer.pipeline import EmptyAnalysisError, run_pipeline
+
+
+class TestRunPipeline:
+    """Test suite for run_pipeline."""
+    
+    def test_pipeline_writes_json_report(self, tmp_path):
+        """Test the full discovery → parse → analyze → report flow."""
+        log_dir = tmp_path / "kiro"
+        log_dir.mkdir()
+        now = datetime.now()
+        (log_dir / "activity.json").write_text('\n'.join(
+            json.dumps({"timestamp": (now - timedelta(hours=i)).isoformat(), "event_type": "request"})
+            for i in range(3)
+        ))
+        config = AnalyzerConfig(kiro_app_folder=log_dir, output_directory=tmp_path / "reports")
+        messages = []
+        
+        content, output_path = run_pipeline(
+            config,
+            now - timedelta(days=1),
+            now + timedelta(minutes=1),
+            "json",
+            use_cache=False,
+            progress=messages.append
+        )
+        
+        assert output_path.parent == tmp_path / "reports"
+        assert output_path.name.startswith("kiro_analysis_")
+        assert json.loads(content)["metrics"]["total_requests"] == 3
+        assert "Parsed 3 log entries within date range" in messages
+    
+    def test_pipeline_raises_when_no_logs_found(self, tmp_path):
+        """Test that an empty log folder raises EmptyAnalysisError."""
+        config = AnalyzerConfig(kiro_app_folder=tmp_path)
+        now = datetime.now()
+        
+        with pytest.raises(EmptyAnalysisError):
+            run_pipeline(config, now - timedelta(days=1), now, "console", use_cache=False)
@@ -1,11 +1,20 @@
 """Unit tests for project-level metrics."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 
 import pytest
 
-from kiro_analyzer.analyzers import ProjectMetricsCalculator
+from kiro_analyzer.analyzers import (
+    ActivityPatternCalculator,
+    CharacterCountCalculator,
+    CodeGenerationCalculator,
+    ModelUsageCalculator,
+    ProjectMetricsCalculator,
+    RequestCountCalculator,
+    ResponseTimeCalculator,
+    ToolUsageCalculator,
+)
 from kiro_analyzer.models import LogEntry
 from kiro_analyzer.utils import ProjectExtractor
 
@@ -77,6 +86,19 @@ class TestProjectExtractor:
         
         project = ProjectExtractor.extract_project_name(entry)
         assert project is None
+    
+    def test_extract_from_unusable_path_values(self):
+        """Test that non-string path values map to 'unknown' instead of raising."""
+        for value in (['/Users/dev/app'], {'path': '/Users/dev/app'}, 42):
+            entry = LogEntry(
+                timestamp=datetime.now(),
+                event_type='request',
+                data={'cwd': value},
+                raw_line='',
+                source_file=Path('test.log')
+            )
+            
+            assert ProjectExtractor.extract_project_name(entry) == 'unknown'
 
 
 class TestProjectMetricsCalculator:
@@ -191,3 +213,45 @@ class TestProjectMetricsCalculator:
         
         assert 'unknown' in result['projects']
         assert result['project_metrics']['unknown']['total_requests'] == 1
+    
+    def test_fused_metrics_match_individual_calculators(self):
+        """Test that per-project metrics match running each calculator separately."""
+        base_time = datetime(2025, 11, 15, 9, 30)
+        entry_data = [
+            ('request', {'status': 'success', 'response_time': 1.5, 'model': 'claude'}),
+            ('request', {'status': 'error', 'response_time_seconds': '3', 'characters': 40}),
+            ('request', {'failed': True, 'lines_generated': '12', 'language': 'python'}),
+            ('conversation_start', {'context': {'model_name': 'claude'}}),
+            ('tool_invocation', {'tool_name': 'file_read', 'content': 'hello'}),
+            ('tool_invocation', {'tool': 'file_write', 'request': 'abc'}),
+            ('response', {'tool': 'grep', 'character_count': 'bad', 'content': 'ignored'}),
+            ('response', {'lines_generated': 30, 'response_time': -1, 'llm_model': 'other'}),
+            ('response', {'response_time': 'nan', 'chars_processed': -5, 'request': 'xyz'}),
+        ]
+        entries = [
+            LogEntry(
+                timestamp=base_time + timedelta(minutes=50 * i),
+                event_type=event_type,
+                data=dict(data, project_name='project-a'),
+                raw_line='',
+                source_file=Path('test.log')
+            )
+            for i, (event_type, data) in enumerate(entry_data)
+        ]
+        
+        expected = {}
+        for calculator in [
+            RequestCountCalculator(),
+            ResponseTimeCalculator(),
+            CodeGenerationCalculator(),
+            ToolUsageCalculator(),
+            ActivityPatternCalculator(),
+            CharacterCountCalculator(),
+            ModelUsageCalculator(),
+        ]:
+            expected.update(calculator.calculate(entries))
+        
+        calculator = ProjectMetricsCalculator()
+        result = calculator.calculate(entries)
+        
+        assert result['project_metrics']['project-a'] == expected
@@ -10,6 +10,7 @@ import pytest
 
 from kiro_analyzer.models import ProductivityMetrics
 from kiro_analyzer.reporters import ReporterService, ReportFormat
+from kiro_analyzer.reporters.reporter_service import CONSOLE_TOP_N
 
 
 @pytest.fixture
@@ -83,6 +84,21 @@ def test_generate_csv_report(sample_metrics):
     assert "tool_usage_file_read" in metric_names
 
 
+@pytest.mark.parametrize("tool_name", ["file_read", "read, write", 'say "hi"', "multi\nline"])
+def test_csv_report_matches_csv_module(sample_metrics, tool_name):
+    """Test CSV output is identical to csv.DictWriter, including quoting."""
+    sample_metrics.tool_usage = {tool_name: 3}
+    reporter = ReporterService()
+    report = reporter.generate_report(sample_metrics, ReportFormat.CSV)
+    
+    expected = StringIO()
+    writer = csv.DictWriter(expected, fieldnames=["metric_name", "value", "unit"])
+    writer.writeheader()
+    writer.writerows(sample_metrics.to_csv_rows())
+    
+    assert report == expected.getvalue()
+
+
 def test_generate_console_report(sample_metrics):
     """Test console report generation."""
     reporter = ReporterService()
@@ -98,6 +114,21 @@ def test_generate_console_report(sample_metrics):
     assert "800" in report
 
 
+def test_console_report_limits_ranked_tables(sample_metrics):
+    """Test that only the most used tools are listed in the console report."""
+    sample_metrics.tool_usage = {
+        f"tool_{i:03d}": i for i in range(CONSOLE_TOP_N + 5)
+    }
+    reporter = ReporterService()
+    report = reporter.generate_report(sample_metrics, ReportFormat.CONSOLE)
+    
+    # The highest counts are shown, the five lowest are summarized
+    assert f"tool_{CONSOLE_TOP_N + 4:03d}" in report
+    assert "tool_005" in report
+    assert "tool_004" not in report
+    assert "5 more not shown" in report
+
+
 def test_save_report(sample_metrics, tmp_path):
     """Test saving report to file."""
     reporter = ReporterService()